@@ -1,92 +1,510 @@
+import numpy as np
 import pandas as pd
-from typing import Any, Callable
-from .config_store import get_config_value
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterable, Mapping, Sequence
+from .config_store import get_config, get_config_value, get_rolling_windows, set_config
+from .histogram import (
+    DEFAULT_RELATIVE_ERROR,
+    LatencyHistogram,
+    bucket_indexes,
+    grouped_histograms,
+    merge_histograms,
+    sliding_sparse_percentiles,
+    sparse_histograms,
+    sparse_percentiles,
+)
+from .results import SecondSeries, TransactionResult
+from .rules import WINDOW_SERIES, evaluate_rules, get_verdict_rules
+from .shared_frames import SharedFrame, export_frame, import_frame, share_tracker_with_workers
+
+DEFAULT_PERCENTILES = [50, 90, 95, 99, 99.9]
+DEFAULT_STEADY_STATE = {"enabled": False, "window_seconds": 10, "tolerance": 0.1}
+# grouped chunk rows RunningTotals collects before merging them again
+RUNNING_TOTALS_FOLD_ROWS = 100_000
 
 
 def analyze_data(
     test_name: str, df_raw: pd.DataFrame
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     if is_resource_dataframe(df_raw):
         return analyze_resource_data(test_name, df_raw)
     return analyze_results_data(test_name, df_raw)
 
+
+def analyze_source(
+    test_name: str, source: pd.DataFrame | Iterable[pd.DataFrame]
+) -> Mapping[str, Any]:
+    """Analyze either a loaded DataFrame or an iterable of results chunks."""
+    if isinstance(source, pd.DataFrame):
+        return analyze_data(test_name, source)
+    return analyze_results_chunks(test_name, source)
+
+
+def analyze_parallel(
+    frames: Mapping[str, pd.DataFrame], jobs: int
+) -> list[Mapping[str, Any]]:
+    """Run `analyze_data` on every frame over a pool of `jobs` processes, in the mapping's order."""
+    results: list[Mapping[str, Any]] = []
+    if not frames:
+        return results
+    share_tracker_with_workers()
+    pending: deque[Future[Mapping[str, Any]]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(frames)),
+        initializer=set_config,
+        initargs=(get_config(),),
+    ) as pool:
+        for test_name in frames:
+            if len(pending) >= 2 * jobs:
+                results.append(pending.popleft().result())
+            pending.append(
+                pool.submit(_analyze_shared, test_name, export_frame(frames[test_name]))
+            )
+        results.extend(future.result() for future in pending)
+    return results
+
+
+def _analyze_shared(test_name: str, frame: SharedFrame) -> Mapping[str, Any]:
+    return analyze_data(test_name, import_frame(frame))
+
+
+def analyze_results_chunks(
+    test_name: str, chunks: Iterable[pd.DataFrame]
+) -> TransactionResult:
+    """Streaming counterpart of `analyze_results_data`; percentiles come from the latency histograms."""
+    aggregator = ResultsAggregator()
+    for chunk in chunks:
+        aggregator.update(chunk)
+    return aggregator.result(test_name)
+
+
+class RunningTotals:
+    """Per-key "sum", "min" or "max" of value columns, folded in chunk by chunk."""
+
+    def __init__(self, keys: list[str], aggregations: dict[str, str]) -> None:
+        self.keys = keys
+        self.aggregations = aggregations
+        self.parts: list[pd.DataFrame] = []
+        self.pending_rows = 0
+        self.folded_rows = 0
+
+    def add(self, frame: pd.DataFrame) -> None:
+        part = frame.groupby(self.keys, sort=False).agg(self.aggregations)
+        self.parts.append(part)
+        self.pending_rows += len(part)
+        if self.pending_rows > max(self.folded_rows, RUNNING_TOTALS_FOLD_ROWS):
+            self._fold()
+
+    def totals(self) -> pd.DataFrame:
+        """One row per key, keys first, sorted by key."""
+        if not self.parts:
+            return pd.DataFrame(
+                {column: np.zeros(0, dtype=np.int64) for column in [*self.keys, *self.aggregations]}
+            )
+        self._fold()
+        return self.parts[0].sort_index().reset_index()
+
+    def _fold(self) -> None:
+        if len(self.parts) > 1:
+            self.parts = [
+                pd.concat(self.parts).groupby(level=self.keys, sort=False).agg(self.aggregations)
+            ]
+        self.folded_rows = len(self.parts[0])
+        self.pending_rows = 0
+
+
+class ResultsAggregator:
+    """Running per-second and per-API aggregates over results chunks."""
+
+    def __init__(self) -> None:
+        self.relative_error = get_histogram_relative_error()
+        self.steady_state_config = get_steady_state_config()
+        api_keys = ["second", "label"] if self.steady_state_config["enabled"] else ["label"]
+        self.label_ids: dict[Any, int] = {}
+        self.response_code_ids: dict[str, int] = {}
+        self.per_second = RunningTotals(
+            ["second"], {"count": "sum", "elapsed_sum": "sum", "errors": "sum"}
+        )
+        self.per_second_codes = RunningTotals(
+            ["second", "code"], {"count": "sum", "errors": "sum"}
+        )
+        self.per_second_buckets = RunningTotals(["second", "bucket"], {"count": "sum"})
+        self.per_api = RunningTotals(
+            api_keys,
+            {
+                "count": "sum",
+                "errors": "sum",
+                "elapsed_sum": "sum",
+                "elapsed_min": "min",
+                "elapsed_max": "max",
+            },
+        )
+        self.per_api_codes = RunningTotals([*api_keys, "code"], {"count": "sum"})
+        self.per_api_buckets = RunningTotals([*api_keys, "bucket"], {"count": "sum"})
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        codes, uniques = pd.factorize(chunk["label"], sort=False)
+        label_ids = np.array(
+            [self.label_ids.setdefault(label, len(self.label_ids)) for label in uniques.tolist()]
+            + [-1],
+            dtype=np.int32,
+        )
+        response_codes, response_code_names = factorize_response_codes(chunk)
+        response_code_ids = np.array(
+            [
+                self.response_code_ids.setdefault(name, len(self.response_code_ids))
+                for name in response_code_names
+            ],
+            dtype=np.int32,
+        )
+        elapsed = chunk["elapsed"].to_numpy()
+        rows = pd.DataFrame(
+            {
+                "second": chunk["timeStamp"].to_numpy("int64") // 1000,
+                "label": label_ids[codes],  # code -1 picks the trailing -1
+                "code": response_code_ids[response_codes],
+                "bucket": bucket_indexes(elapsed, self.relative_error),
+                "errors": (~chunk["success"].to_numpy(bool)).astype(np.int64),
+                "elapsed": elapsed,
+                "elapsed_sum": elapsed.astype(np.float64),
+            }
+        )
+        cells = (
+            rows.groupby(["second", "label", "code"], sort=False)
+            .agg(
+                count=("errors", "size"),
+                errors=("errors", "sum"),
+                elapsed_sum=("elapsed_sum", "sum"),
+                elapsed_min=("elapsed", "min"),
+                elapsed_max=("elapsed", "max"),
+            )
+            .reset_index()
+        )
+        # NaN response times are counted as requests but not bucketed
+        buckets = (
+            rows[~np.isnan(rows["elapsed_sum"].to_numpy())]
+            .groupby(["second", "label", "bucket"], sort=False)
+            .size()
+            .reset_index(name="count")
+        )
+        self.per_second.add(cells)
+        self.per_second_codes.add(cells)
+        self.per_second_buckets.add(buckets)
+        # rows without a label count per second only, as in get_group_stats
+        self.per_api.add(cells[cells["label"] >= 0])
+        self.per_api_codes.add(cells[cells["label"] >= 0])
+        self.per_api_buckets.add(buckets[buckets["label"] >= 0])
+
+    def result(self, test_name: str) -> TransactionResult:
+        percentiles = get_percentiles()
+        names = [percentile_name(percentile) for percentile in percentiles]
+        relative_error = self.relative_error
+
+        per_second = self.per_second.totals()
+        seconds = per_second["second"].to_numpy(np.int64)
+        start_second = int(seconds[0]) if len(seconds) else 0
+        counts = np.zeros(int(seconds[-1]) - start_second + 1 if len(seconds) else 0, np.int64)
+        counts[seconds - start_second] = per_second["count"].to_numpy()
+        steady_state = None
+        first, last = 0, len(counts) - 1
+        if self.steady_state_config["enabled"]:
+            first, last, steady_state = steady_state_window(
+                counts,
+                self.steady_state_config["window_seconds"],
+                self.steady_state_config["tolerance"],
+            )
+        # seconds low..low + length - 1 are analyzed
+        low, length = start_second + first, last - first + 1
+
+        per_second = _within_seconds(per_second, low, length)
+        index = per_second["second"].to_numpy(np.int64)
+        count, errors = np.zeros(length, np.int64), np.zeros(length, np.int64)
+        elapsed_sum = np.zeros(length)
+        count[index] = per_second["count"].to_numpy()
+        errors[index] = per_second["errors"].to_numpy()
+        elapsed_sum[index] = per_second["elapsed_sum"].to_numpy()
+        second_buckets = _within_seconds(self.per_second_buckets.totals(), low, length)
+        histograms = tuple(
+            second_buckets[column].to_numpy(np.int64) for column in ("second", "bucket", "count")
+        )
+        second_bins = second_bins_from_arrays(
+            low,
+            count,
+            elapsed_sum,
+            errors,
+            sparse_percentiles(*histograms, length, percentiles, relative_error),
+            histograms if window_percentiles_requested() else None,
+        )
+        # keep second offsets on the untrimmed test's timeline
+        second_bins["origin"] = first + 1
+
+        # global ids follow first appearance; renumber them in name order
+        response_code_names = sorted(self.response_code_ids)
+        renumber = np.empty(len(response_code_names), dtype=np.int64)
+        renumber[[self.response_code_ids[name] for name in response_code_names]] = np.arange(
+            len(response_code_names)
+        )
+        second_codes = _within_seconds(self.per_second_codes.totals(), low, length)
+        code_index = (
+            second_codes["second"].to_numpy(np.int64),
+            renumber[second_codes["code"].to_numpy(np.int64)],
+        )
+        for key, column in (("breakdown", "count"), ("error_breakdown", "errors")):
+            second_bins[key] = np.zeros((length, len(response_code_names)), dtype=np.int64)
+            second_bins[key][code_index] = second_codes[column].to_numpy()
+
+        per_api = self._api_totals(self.per_api, low, length)
+        id_labels = list(self.label_ids)
+        rows = {id_labels[label_id]: row for row, label_id in enumerate(per_api["label"].tolist())}
+        labels = list(rows)
+        try:
+            labels = sorted(labels)
+        except TypeError:
+            pass
+        columns = {
+            column: per_api[column].tolist()
+            for column in ("count", "errors", "elapsed_sum", "elapsed_min", "elapsed_max")
+        }
+
+        def per_label(column: str) -> dict[Any, Any]:
+            return {label: columns[column][rows[label]] for label in labels}
+
+        transaction_count_per_api = per_label("count")
+        error_count_per_api = per_label("errors")
+        minimum_per_api = per_label("elapsed_min")
+        maximum_per_api = per_label("elapsed_max")
+        overall_transaction_count = sum(transaction_count_per_api.values())
+        overall_elapsed_sum = sum(columns["elapsed_sum"])
+
+        api_codes = self._api_totals(self.per_api_codes, low, length)
+        code_table = np.zeros((len(self.label_ids), len(response_code_names)), dtype=np.int64)
+        code_table[
+            api_codes["label"].to_numpy(np.int64), renumber[api_codes["code"].to_numpy(np.int64)]
+        ] = api_codes["count"].to_numpy()
+
+        api_buckets = {
+            label_id: (group["bucket"].to_numpy(), group["count"].to_numpy())
+            for label_id, group in self._api_totals(self.per_api_buckets, low, length).groupby(
+                "label", sort=False
+            )
+        }
+        histogram_per_api = {
+            label: LatencyHistogram.from_buckets(
+                *api_buckets.get(self.label_ids[label], ((), ())),
+                relative_error,
+                minimum_per_api[label],
+                maximum_per_api[label],
+            )
+            for label in labels
+        }
+        percentiles_per_api = {
+            label: histogram.percentiles(percentiles)
+            for label, histogram in histogram_per_api.items()
+        }
+        histogram = merge_histograms(histogram_per_api.values()) or LatencyHistogram(
+            relative_error
+        )
+
+        analysis = TransactionResult(
+            test_name=test_name,
+            transaction_count_per_api=transaction_count_per_api,
+            error_count_per_api=error_count_per_api,
+            overall_transaction_count=overall_transaction_count,
+            overall_error_count=sum(error_count_per_api.values()),
+            test_duration_in_seconds=length,
+            error_count_per_second=get_error_count_per_second(second_bins),
+            transaction_count_per_second=get_tps_by_second(second_bins),
+            avg_response_time_per_second=get_avg_response_time_per_second(second_bins),
+            overall_maximum_response_time=max(maximum_per_api.values(), default=None),
+            overall_minimum_response_time=min(minimum_per_api.values(), default=None),
+            overall_avg_response_time=(
+                overall_elapsed_sum / overall_transaction_count
+                if overall_transaction_count
+                else 0.0
+            ),
+            maximum_response_time_per_api=maximum_per_api,
+            minimum_response_time_per_api=minimum_per_api,
+            average_response_time_per_api={
+                label: columns["elapsed_sum"][rows[label]] / columns["count"][rows[label]]
+                for label in labels
+            },
+            response_time_percentiles=dict(zip(names, histogram.percentiles(percentiles))),
+            response_time_percentiles_per_api={
+                name: {label: percentiles_per_api[label][i] for label in labels}
+                for i, name in enumerate(names)
+            },
+            response_time_percentiles_per_second=get_percentiles_per_second(
+                second_bins, percentiles
+            ),
+            response_time_histogram=histogram,
+            response_time_histogram_per_api=histogram_per_api,
+            rolling_windows=get_rolling_metrics(
+                second_bins, get_rolling_windows(), percentiles, relative_error
+            ),
+            steady_state=steady_state,
+            **get_response_code_breakdown(
+                response_code_names,
+                {label: code_table[self.label_ids[label]] for label in labels},
+                second_bins,
+            ),
+        )
+        return apply_verdict(analysis)
+
+    @staticmethod
+    def _api_totals(totals: RunningTotals, low: int, length: int) -> pd.DataFrame:
+        # per-API totals kept per second (trimming) are summed over the kept seconds
+        frame = totals.totals()
+        if "second" not in totals.keys:
+            return frame
+        keys = [key for key in totals.keys if key != "second"]
+        return (
+            _within_seconds(frame, low, length)
+            .groupby(keys, sort=True)
+            .agg(totals.aggregations)
+            .reset_index()
+        )
+
+
+def _within_seconds(frame: pd.DataFrame, low: int, length: int) -> pd.DataFrame:
+    """Rows of seconds low..low + length - 1, "second" re-based to an index from 0."""
+    index = frame["second"].to_numpy(np.int64) - low
+    inside = (index >= 0) & (index < length)
+    return frame[inside].assign(second=index[inside])
+
+
 def is_resource_dataframe(df: pd.DataFrame) -> bool:
-    required = {"timestamp", "podname", "namespace", "container", "cpu", "memory"}
-    return required.issubset(df.columns)
+    required = {"timestamp", "podname", "namespace", "container"}
+    raw = {"cpu", "memory"}
+    numeric = {"cpu_mcores", "memory_bytes"}
+    return required.issubset(df.columns) and (
+        raw.issubset(df.columns) or numeric.issubset(df.columns)
+    )
 
 
 def analyze_results_data(
-    test_name: str, df_raw: pd.DataFrame 
-) -> dict[str, Any]:
-    dfs_sorted_by_apis = sort_by(df_raw, "label")
+    test_name: str, df_raw: pd.DataFrame
+) -> TransactionResult:
+    steady_state = None
+    steady_state_config = get_steady_state_config()
+    if steady_state_config["enabled"]:
+        df_raw, steady_state = trim_to_steady_state(
+            df_raw, steady_state_config["window_seconds"], steady_state_config["tolerance"]
+        )
 
-    transaction_count_per_api = get_counts_by_group(dfs_sorted_by_apis, len)
-    error_count_per_api = get_counts_by_group(
-        dfs_sorted_by_apis, lambda df: get_error_count_from_df(df)
+    percentiles = get_percentiles()
+    relative_error = get_histogram_relative_error()
+    response_codes, response_code_names = factorize_response_codes(df_raw)
+    breakdown = (response_codes, len(response_code_names))
+    api_stats = get_group_stats(
+        df_raw,
+        "label",
+        ["elapsed"],
+        error_column="success",
+        percentiles=percentiles,
+        histogram_error=relative_error,
+        breakdown=breakdown,
     )
+    histogram_per_api = api_stats["elapsed"]["histograms"]
+
+    transaction_count_per_api = api_stats["count"]
+    error_count_per_api = api_stats["errors"]
 
     overall_transaction_count = sum(transaction_count_per_api.values())
     overall_error_count = sum(error_count_per_api.values())
 
     test_duration_in_seconds = get_test_duration_in_seconds(df_raw)
 
-    dfs_by_seconds = get_dfs_by_seconds(df_raw)
-    tps_by_second = get_tps_by_second(dfs_by_seconds)
-    avg_resp_by_second = get_avg_response_time_per_second(dfs_by_seconds)
-    error_count_per_second = get_error_count_per_second(dfs_by_seconds)
-
-    response_time_stats = get_response_time_stats(df_raw, dfs_sorted_by_apis)
-    verdict = evaluate_results(
-        overall_error_count, overall_transaction_count, tps_by_second
+    second_bins = get_second_bins(
+        df_raw,
+        percentiles,
+        relative_error if window_percentiles_requested() else None,
+        breakdown,
+    )
+    if steady_state is not None:
+        # keep second offsets on the untrimmed test's timeline; the plateau
+        # starts on a second with requests, so that is where the bins start
+        second_bins["origin"] = steady_state["start_offset"]
+    tps_by_second = get_tps_by_second(second_bins)
+    avg_resp_by_second = get_avg_response_time_per_second(second_bins)
+    error_count_per_second = get_error_count_per_second(second_bins)
+    rolling_windows = get_rolling_metrics(
+        second_bins, get_rolling_windows(), percentiles, relative_error
     )
 
-    return {
-        "test_name": test_name,
-        "transaction_count_per_api": transaction_count_per_api,
-        "error_count_per_api": error_count_per_api,
-        "overall_transaction_count": overall_transaction_count,
-        "overall_error_count": overall_error_count,
-        "test_duration_in_seconds": test_duration_in_seconds,
-        "error_count_per_second": error_count_per_second,
-        "transaction_count_per_second": tps_by_second,
-        "avg_response_time_per_second": avg_resp_by_second,
-        "overall_maximum_response_time": response_time_stats["overall_max"],
-        "overall_minimum_response_time": response_time_stats["overall_min"],
-        "overall_avg_response_time": response_time_stats["overall_avg"],
-        "maximum_response_time_per_api": response_time_stats["max_per_group"],
-        "minimum_response_time_per_api": response_time_stats["min_per_group"],
-        "average_response_time_per_api": response_time_stats["avg_per_group"],
-        "verdict": verdict,
-    }
+    response_time_stats = get_response_time_stats(df_raw, api_stats)
+    elapsed = df_raw["elapsed"].to_numpy()
+    overall_percentiles = grouped_percentiles(
+        np.zeros(len(elapsed), dtype=np.int64), elapsed, 1, percentiles
+    )[0]
+
+    analysis = TransactionResult(
+        test_name=test_name,
+        transaction_count_per_api=transaction_count_per_api,
+        error_count_per_api=error_count_per_api,
+        overall_transaction_count=overall_transaction_count,
+        overall_error_count=overall_error_count,
+        test_duration_in_seconds=test_duration_in_seconds,
+        error_count_per_second=error_count_per_second,
+        transaction_count_per_second=tps_by_second,
+        avg_response_time_per_second=avg_resp_by_second,
+        overall_maximum_response_time=response_time_stats["overall_max"],
+        overall_minimum_response_time=response_time_stats["overall_min"],
+        overall_avg_response_time=response_time_stats["overall_avg"],
+        maximum_response_time_per_api=response_time_stats["max_per_group"],
+        minimum_response_time_per_api=response_time_stats["min_per_group"],
+        average_response_time_per_api=response_time_stats["avg_per_group"],
+        response_time_percentiles=dict(
+            zip(map(percentile_name, percentiles), overall_percentiles.tolist())
+        ),
+        response_time_percentiles_per_api=api_stats["elapsed"]["percentiles"],
+        response_time_percentiles_per_second=get_percentiles_per_second(
+            second_bins, percentiles
+        ),
+        response_time_histogram=merge_histograms(histogram_per_api.values())
+        or LatencyHistogram(relative_error),
+        response_time_histogram_per_api=histogram_per_api,
+        rolling_windows=rolling_windows,
+        steady_state=steady_state,
+        **get_response_code_breakdown(
+            response_code_names, api_stats["breakdown"], second_bins
+        ),
+    )
+    return apply_verdict(analysis)
 
 
 def analyze_resource_data(test_name: str, df_raw: pd.DataFrame) -> dict[str, Any]:
     df = add_numeric_resource_columns(df_raw)
-    ts_order = {ts: idx for idx, ts in enumerate(sorted(df["timestamp"].unique()), start=1)}
-    df["timestamp_offset"] = df["timestamp"].map(ts_order)
-    dfs_by_pod = sort_by(df, "podname")
-    dfs_by_timestamp = sort_by(df, "timestamp_offset")
-
-    cpu_avg_per_pod = get_numeric_by_group(dfs_by_pod, "cpu_mcores", "mean")
-    cpu_max_per_pod = get_numeric_by_group(dfs_by_pod, "cpu_mcores", "max")
-    cpu_min_per_pod = get_numeric_by_group(dfs_by_pod, "cpu_mcores", "min")
-    mem_avg_per_pod = get_numeric_by_group(dfs_by_pod, "memory_bytes", "mean")
-    mem_max_per_pod = get_numeric_by_group(dfs_by_pod, "memory_bytes", "max")
-    mem_min_per_pod = get_numeric_by_group(dfs_by_pod, "memory_bytes", "min")
-
-    cpu_avg_over_time = get_numeric_by_group(dfs_by_timestamp, "cpu_mcores", "mean")
-    cpu_max_over_time = get_numeric_by_group(dfs_by_timestamp, "cpu_mcores", "max")
-    mem_avg_over_time = get_numeric_by_group(dfs_by_timestamp, "memory_bytes", "mean")
-    mem_max_over_time = get_numeric_by_group(dfs_by_timestamp, "memory_bytes", "max")
+    # 1-based position of each snapshot in time order
+    df["timestamp_offset"], start_timestamp, end_timestamp = get_snapshot_offsets(
+        df["timestamp"]
+    )
+    numeric_columns = ["cpu_mcores", "memory_bytes"]
+    pod_stats = get_group_stats(df, "podname", numeric_columns)
+    time_stats = get_group_stats(df, "timestamp_offset", numeric_columns)
+
+    cpu_avg_per_pod = pod_stats["cpu_mcores"]["mean"]
+    cpu_max_per_pod = pod_stats["cpu_mcores"]["max"]
+    cpu_min_per_pod = pod_stats["cpu_mcores"]["min"]
+    mem_avg_per_pod = pod_stats["memory_bytes"]["mean"]
+    mem_max_per_pod = pod_stats["memory_bytes"]["max"]
+    mem_min_per_pod = pod_stats["memory_bytes"]["min"]
+
+    cpu_avg_over_time = time_stats["cpu_mcores"]["mean"]
+    cpu_max_over_time = time_stats["cpu_mcores"]["max"]
+    mem_avg_over_time = time_stats["memory_bytes"]["mean"]
+    mem_max_over_time = time_stats["memory_bytes"]["max"]
 
     overall = {
         "overall_avg_cpu_mcores": df["cpu_mcores"].mean(),
         "overall_max_cpu_mcores": df["cpu_mcores"].max(),
         "overall_avg_memory_bytes": df["memory_bytes"].mean(),
         "overall_max_memory_bytes": df["memory_bytes"].max(),
-        "start_timestamp": df["timestamp"].min(),
-        "end_timestamp": df["timestamp"].max(),
-        "snapshot_count": len(df["timestamp"].unique()),
+        "start_timestamp": start_timestamp,
+        "end_timestamp": end_timestamp,
+        "snapshot_count": int(df["timestamp_offset"].max()) if len(df) else 0,
     }
 
     return {
@@ -104,168 +522,568 @@ def analyze_resource_data(test_name: str, df_raw: pd.DataFrame) -> dict[str, Any
         "overall": overall,
     }
 
-def get_numeric_by_group(
-    grouped: dict[Any, pd.DataFrame], column: str, operation: str
-) -> dict[Any, float]:
-    results: dict[Any, float] = {}
-    for name, df in grouped.items():
-        if operation == "mean":
-            results[name] = df[column].mean()
-        elif operation == "max":
-            results[name] = df[column].max()
-        elif operation == "min":
-            results[name] = df[column].min()
-    return results
+def apply_verdict(result: TransactionResult) -> TransactionResult:
+    """Evaluate the configured verdict rules and set the result's verdict."""
+    result.verdict_rules = evaluate_rules(result, get_verdict_rules())
+    result.verdict = "PASS" if all(outcome.passed for outcome in result.verdict_rules) else "FAIL"
+    return result
+
+
+def second_bins_from_arrays(
+    start_second: int,
+    count: Any,
+    elapsed_sum: Any,
+    errors: Any,
+    percentiles: np.ndarray | None = None,
+    histograms: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> dict[str, Any]:
+    bins = {
+        "start_second": start_second,
+        "count": np.asarray(count, dtype=np.int64),
+        "elapsed_sum": np.asarray(elapsed_sum, dtype=np.float64),
+        "errors": np.asarray(errors, dtype=np.int64),
+        # second offset of index 0
+        "origin": 1,
+    }
+    if percentiles is not None:
+        bins["percentiles"] = percentiles
+    if histograms is not None:
+        # (second index, bucket, count) pairs from sparse_histograms
+        bins["histograms"] = histograms
+    return bins
 
-def evaluate_results(
-    overall_error_count: int,
-    overall_transaction_count: int,
-    tps_by_second: dict[int, float]
-) -> str:
-    evaluation_config = get_config_value("evaluation")
-    if (overall_error_count / overall_transaction_count) > evaluation_config["error_rate_threshold"]:
-        return "FAIL"
-    for tps in tps_by_second.values():
-        if tps < evaluation_config["tps_threshold"]:
-            return "FAIL"
-    return "PASS"
-
-
-def get_tps_by_second(
-    dfs_by_seconds: dict[int, pd.DataFrame],
-) -> dict[int, float]:
-    results: dict[int, float] = {}
-    for second, df in dfs_by_seconds.items():
-        results[second] = len(df) / 1.0
-    return results
+
+def get_tps_by_second(second_bins: dict[str, Any]) -> SecondSeries:
+    return SecondSeries(second_bins["count"].astype(np.float64), second_bins["origin"])
 
 
 def get_avg_response_time_per_second(
-    dfs_by_seconds: dict[int, pd.DataFrame],
-) -> dict[int, float]:
-    results: dict[int, float] = {}
-    for second, df in dfs_by_seconds.items():
-        results[second] = float(df["elapsed"].mean()) if not df.empty else 0.0
-    return results
+    second_bins: dict[str, Any],
+) -> SecondSeries:
+    counts = second_bins["count"]
+    averages = np.divide(
+        second_bins["elapsed_sum"],
+        counts,
+        out=np.zeros(len(counts)),
+        where=counts > 0,
+    )
+    return SecondSeries(averages, second_bins["origin"])
 
 
-def get_dfs_by_seconds(df: pd.DataFrame) -> dict[int, pd.DataFrame]:
-    results: dict[int, pd.DataFrame] = {}
-    start_sec = df["timeStamp"].min() // 1000
-    end_sec = df["timeStamp"].max() // 1000
-    for offset, second in enumerate(range(start_sec, end_sec + 1), start=1):
-        results[offset] = df[
-            (df["timeStamp"] >= second * 1000) & (df["timeStamp"] < (second + 1) * 1000)
-        ]
-    return results
+def get_percentiles_per_second(
+    second_bins: dict[str, Any], percentiles: Sequence[float]
+) -> dict[str, SecondSeries]:
+    """Per-second percentiles from `get_second_bins`; empty seconds are 0.0."""
+    table = np.nan_to_num(second_bins["percentiles"], nan=0.0)
+    return {
+        percentile_name(percentile): SecondSeries(
+            np.ascontiguousarray(table[:, i]), second_bins["origin"]
+        )
+        for i, percentile in enumerate(percentiles)
+    }
+
+
+def get_second_bins(
+    df: pd.DataFrame,
+    percentiles: Sequence[float] = (),
+    histogram_error: float | None = None,
+    breakdown: tuple[np.ndarray, int] | None = None,
+) -> dict[str, Any]:
+    """Bin results into the seconds of the test in a single pass; index 0 is offset 1."""
+    seconds = df["timeStamp"].to_numpy("int64") // 1000
+    elapsed = df["elapsed"].to_numpy()
+    if not len(seconds):
+        bins = second_bins_from_arrays(
+            0,
+            [],
+            [],
+            [],
+            np.zeros((0, len(percentiles))) if percentiles else None,
+            (
+                sparse_histograms(np.zeros(0, dtype=np.int64), [], histogram_error)
+                if histogram_error is not None
+                else None
+            ),
+        )
+        if breakdown is not None:
+            bins["breakdown"] = bins["error_breakdown"] = np.zeros(
+                (0, breakdown[1]), dtype=np.int64
+            )
+        return bins
+    start_second = int(seconds.min())
+    index = seconds - start_second
+    length = int(index.max()) + 1
+    failed = ~df["success"].to_numpy(bool)
+    bins = second_bins_from_arrays(
+        start_second,
+        np.bincount(index, minlength=length),
+        np.bincount(index, weights=elapsed.astype("float64"), minlength=length),
+        np.bincount(index[failed], minlength=length),
+        grouped_percentiles(index, elapsed, length, percentiles) if percentiles else None,
+        (
+            sparse_histograms(index, elapsed, histogram_error)
+            if histogram_error is not None
+            else None
+        ),
+    )
+    if breakdown is not None:
+        codes, code_count = breakdown
+        bins["breakdown"] = code_count_table(index, length, codes, code_count)
+        bins["error_breakdown"] = code_count_table(
+            index[failed], length, codes[failed], code_count
+        )
+    return bins
+
+
+def window_percentiles_requested() -> bool:
+    """Whether rolling windows get response time percentiles (they need per-second histograms)."""
+    if get_config_value("rolling_window_percentiles", False):
+        return True
+    return any(
+        rule.window is not None and rule.metric not in WINDOW_SERIES
+        for rule in get_verdict_rules()
+    )
+
+
+def get_steady_state_config() -> dict[str, Any]:
+    """The "steady_state" config section with defaults applied."""
+    config = {**DEFAULT_STEADY_STATE, **(get_config_value("steady_state", {}) or {})}
+    config["enabled"] = bool(config["enabled"])
+    config["window_seconds"] = int(config["window_seconds"])
+    config["tolerance"] = float(config["tolerance"])
+    if config["window_seconds"] <= 0 or config["tolerance"] <= 0:
+        raise ValueError(
+            "steady_state.window_seconds and steady_state.tolerance must be positive"
+        )
+    return config
+
+
+def find_steady_state(
+    counts: np.ndarray, window_seconds: int, tolerance: float
+) -> tuple[int, int] | None:
+    """First and last index of the throughput plateau of a per-second series, None without requests."""
+    if not counts.any():
+        return None
+    prefix = np.concatenate(([0.0], np.cumsum(counts, dtype=np.float64)))
+    index = np.arange(len(counts))
+    starts = np.clip(index - window_seconds // 2, 0, len(counts))
+    ends = np.clip(starts + window_seconds, 0, len(counts))
+    means = (prefix[ends] - prefix[starts]) / (ends - starts)
+    # the level comes from the longest run of means within one +/- tolerance
+    # band, so long ramps or shorter load steps cannot pull it off the plateau;
+    # seconds outside the first..last steady one are trimmed, dips are kept
+    first, last = _longest_band_run(means, tolerance)
+    level = float(np.median(means[first : last + 1]))
+    steady = np.flatnonzero((np.abs(means - level) <= tolerance * level) & (counts > 0))
+    if not len(steady):
+        return None
+    return int(steady[0]), int(steady[-1])
+
+
+def _longest_band_run(values: np.ndarray, tolerance: float) -> tuple[int, int]:
+    # longest run of positive values that all lie within +/- tolerance of a
+    # common level, i.e. max * (1 - tolerance) <= min * (1 + tolerance);
+    # sliding window with monotonic deques of the run's max and min
+    best: tuple[int, int] | None = None
+    highs: deque[int] = deque()
+    lows: deque[int] = deque()
+    start = 0
+    for end, value in enumerate(values.tolist()):
+        if value <= 0:
+            highs.clear()
+            lows.clear()
+            start = end + 1
+            continue
+        while highs and values[highs[-1]] <= value:
+            highs.pop()
+        highs.append(end)
+        while lows and values[lows[-1]] >= value:
+            lows.pop()
+        lows.append(end)
+        while values[highs[0]] * (1 - tolerance) > values[lows[0]] * (1 + tolerance):
+            start += 1
+            if highs[0] < start:
+                highs.popleft()
+            if lows[0] < start:
+                lows.popleft()
+        if best is None or end - start > best[1] - best[0]:
+            best = (start, end)
+    assert best is not None
+    return best
+
+
+def trim_to_steady_state(
+    df: pd.DataFrame, window_seconds: int, tolerance: float
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Drop the ramp-up/ramp-down seconds around the throughput plateau."""
+    counts = get_second_bins(df)["count"]
+    first, last, steady_state = steady_state_window(counts, window_seconds, tolerance)
+    if len(df) and (first > 0 or last < len(counts) - 1):
+        seconds = df["timeStamp"].to_numpy("int64") // 1000
+        index = seconds - seconds.min()
+        df = df[(index >= first) & (index <= last)].reset_index(drop=True)
+    return df, steady_state
+
+
+def steady_state_window(
+    counts: np.ndarray, window_seconds: int, tolerance: float
+) -> tuple[int, int, dict[str, Any]]:
+    """Indexes of the first and last second to keep, and the boundaries found."""
+    bounds = find_steady_state(counts, window_seconds, tolerance)
+    first, last = bounds if bounds is not None else (0, len(counts) - 1)
+    return first, last, {
+        "detected": bounds is not None,
+        "start_offset": first + 1,
+        "end_offset": last + 1,
+        "trimmed_start_seconds": first,
+        "trimmed_end_seconds": len(counts) - 1 - last,
+        "trimmed_transactions": int(counts[:first].sum() + counts[last + 1 :].sum()),
+    }
+
+
+def get_rolling_metrics(
+    second_bins: dict[str, Any],
+    windows: Sequence[int],
+    percentiles: Sequence[float] = (),
+    histogram_error: float = DEFAULT_RELATIVE_ERROR,
+) -> dict[int, dict[str, Any]]:
+    """Trailing sliding-window metrics for every second of the test."""
+    counts = second_bins["count"]
+    origin = second_bins["origin"]
+    ends = np.arange(1, len(counts) + 1)
+    prefix = {
+        name: np.concatenate(([0], np.cumsum(second_bins[name])))
+        for name in ("count", "elapsed_sum", "errors")
+    }
+    histograms = second_bins.get("histograms") if percentiles else None
+
+    rolling: dict[int, dict[str, Any]] = {}
+    for window in windows:
+        starts = np.maximum(ends - window, 0)
+        spans = ends - starts
+        window_count, window_elapsed, window_errors = (
+            prefix[name][ends] - prefix[name][starts]
+            for name in ("count", "elapsed_sum", "errors")
+        )
+        has_requests = window_count > 0
+        metrics: dict[str, Any] = {
+            "transactions_per_second": SecondSeries(window_count / spans, origin),
+            "error_rate": SecondSeries(
+                np.divide(window_errors, window_count, out=np.zeros(len(ends)), where=has_requests),
+                origin,
+            ),
+            "avg_response_time": SecondSeries(
+                np.divide(window_elapsed, window_count, out=np.zeros(len(ends)), where=has_requests),
+                origin,
+            ),
+        }
+        if histograms is not None:
+            values = np.nan_to_num(
+                sliding_sparse_percentiles(
+                    *histograms, len(counts), window, percentiles, histogram_error
+                ),
+                nan=0.0,
+            )
+            metrics["response_time_percentiles"] = {
+                percentile_name(percentile): SecondSeries(
+                    np.ascontiguousarray(values[:, i]), origin
+                )
+                for i, percentile in enumerate(percentiles)
+            }
+        rolling[window] = metrics
+    return rolling
 
 
 def get_test_duration_in_seconds(df_raw: pd.DataFrame) -> int:
+    if df_raw.empty:
+        return 0
     return df_raw["timeStamp"].max() // 1000 - df_raw["timeStamp"].min() // 1000 + 1
 
 
-def get_error_count_per_second(
-    dfs_by_seconds: dict[int, pd.DataFrame],
-) -> dict[int, int]:
-    return get_counts_by_group(dfs_by_seconds, lambda df: get_error_count_from_df(df))
+def get_error_count_per_second(second_bins: dict[str, Any]) -> SecondSeries:
+    return SecondSeries(second_bins["errors"], second_bins["origin"])
+
+
+def factorize_response_codes(df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    """Code of every row's response code, and the sorted code names."""
+    if "responseCode" not in df.columns:
+        return np.zeros(len(df), dtype=np.int64), ["missing"]
+    codes, uniques = pd.factorize(df["responseCode"], use_na_sentinel=False)
+    name_codes, names = pd.factorize(
+        np.array([response_code_name(value) for value in list(uniques)], dtype=object),
+        sort=True,
+    )
+    return name_codes[codes], list(names)
 
 
-def get_error_count_per_api(
-    dfs_sorted_by_api: dict[str, pd.DataFrame],
-) -> dict[str, int]:
-    return get_counts_by_group(dfs_sorted_by_api, lambda df: get_error_count_from_df(df))
+def response_code_name(value: Any) -> str:
+    if pd.isna(value):
+        return "missing"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
 
 
-def get_error_count_from_df(df: pd.DataFrame) -> int:
-    return len(df[~df["success"]])
+def response_code_class(name: str) -> str:
+    """"2xx", "4xx", "5xx", ... for HTTP status codes, "other" for anything else."""
+    if len(name) == 3 and name.isdigit():
+        return f"{name[0]}xx"
+    return "other"
 
 
-def get_transaction_count_per_api(
-    dfs_sorted_by_api: dict[str, pd.DataFrame],
-) -> dict[str, int]:
-    return get_counts_by_group(dfs_sorted_by_api, len)
+def get_response_code_breakdown(
+    names: list[str],
+    per_api: dict[Any, np.ndarray],
+    second_bins: dict[str, Any],
+) -> dict[str, Any]:
+    """Response code and code class counts overall, per API and per second."""
+    class_codes, class_names = pd.factorize(
+        np.array([response_code_class(name) for name in names], dtype=object), sort=True
+    )
+    to_classes = np.zeros((len(names), len(class_names)), dtype=np.int64)
+    to_classes[np.arange(len(names)), class_codes] = 1
+    per_second = second_bins["breakdown"]
+    per_second_classes = per_second @ to_classes
+    errors_per_second_classes = second_bins["error_breakdown"] @ to_classes
+    origin = second_bins["origin"]
+
+    def non_zero(row: np.ndarray, keys: Sequence[str]) -> dict[str, int]:
+        return {key: count for key, count in zip(keys, row.tolist()) if count}
+
+    def series(table: np.ndarray, keys: Sequence[str]) -> dict[str, SecondSeries]:
+        totals = table.sum(axis=0)
+        return {
+            key: SecondSeries(np.ascontiguousarray(table[:, i]), origin)
+            for i, key in enumerate(keys)
+            if totals[i]
+        }
+
+    return {
+        "response_code_counts": non_zero(per_second.sum(axis=0), names),
+        "response_code_counts_per_api": {
+            label: non_zero(row, names) for label, row in per_api.items()
+        },
+        "response_code_counts_per_second": series(per_second, names),
+        "response_code_class_counts": non_zero(per_second_classes.sum(axis=0), class_names),
+        "response_code_class_counts_per_api": {
+            label: non_zero(row @ to_classes, class_names) for label, row in per_api.items()
+        },
+        "response_code_class_counts_per_second": series(per_second_classes, class_names),
+        "error_count_per_second_by_class": series(errors_per_second_classes, class_names),
+    }
 
 
-def sort_by(df_raw: pd.DataFrame, column: str) -> dict[str, pd.DataFrame]:
-    results_dict: dict[Any, pd.DataFrame] = {}
-    unique_vals = list(df_raw[column].unique())
+def get_group_stats(
+    df: pd.DataFrame,
+    column: str,
+    value_columns: list[str],
+    error_column: str | None = None,
+    percentiles: Sequence[float] = (),
+    histogram_error: float | None = None,
+    breakdown: tuple[np.ndarray, int] | None = None,
+) -> dict[str, Any]:
+    """Aggregate `value_columns` per distinct value of `column` in one pass."""
+    codes, uniques = pd.factorize(df[column], sort=False)
+    keys = uniques.tolist()
+    order = list(range(len(keys)))
     try:
-        unique_vals = sorted(unique_vals)
+        order.sort(key=keys.__getitem__)
     except TypeError:
         pass
-    for value in unique_vals:
-        results_dict[value] = df_raw[df_raw[column] == value]
-    return results_dict
 
+    frame = pd.DataFrame({name: df[name].to_numpy() for name in value_columns})
+    if error_column is not None:
+        frame["errors"] = ~df[error_column].to_numpy(bool)
+    grouped = frame.groupby(codes)
+    # rows with a missing key (code -1) form a group of their own; skip it
+    stats = grouped.agg({name: ["min", "max", "mean", "sum"] for name in value_columns})
+    stats = stats.reindex(order)
+    counts = grouped.size().reindex(order)
+    ordered_keys = [keys[code] for code in order]
 
-def get_counts_by_group(
-    grouped: dict[Any, pd.DataFrame], counter: Callable[[pd.DataFrame], int]
-) -> dict[Any, int]:
-    results: dict[Any, int] = {}
-    for name, df in grouped.items():
-        results[name] = counter(df)
+    results: dict[str, Any] = {"count": dict(zip(ordered_keys, counts.tolist()))}
+    if error_column is not None:
+        errors = grouped["errors"].sum().reindex(order)
+        results["errors"] = dict(zip(ordered_keys, errors.tolist()))
+    for name in value_columns:
+        results[name] = {
+            stat: dict(zip(ordered_keys, stats[(name, stat)].tolist()))
+            for stat in ("min", "max", "mean", "sum")
+        }
+        if percentiles:
+            table = grouped_percentiles(codes, df[name].to_numpy(), len(keys), percentiles)
+            results[name]["percentiles"] = {
+                percentile_name(percentile): dict(zip(ordered_keys, table[order, i].tolist()))
+                for i, percentile in enumerate(percentiles)
+            }
+        if histogram_error is not None:
+            histograms = grouped_histograms(
+                codes, df[name].to_numpy(), len(keys), histogram_error
+            )
+            results[name]["histograms"] = {keys[code]: histograms[code] for code in order}
+    if breakdown is not None:
+        table = code_count_table(codes, len(keys), *breakdown)
+        results["breakdown"] = {keys[code]: table[code] for code in order}
     return results
 
 
+def code_count_table(
+    group_codes: np.ndarray, group_count: int, codes: np.ndarray, code_count: int
+) -> np.ndarray:
+    """(group_count, code_count) row counts with one bincount; code -1 rows are skipped."""
+    valid = (group_codes >= 0) & (codes >= 0)
+    table = np.bincount(
+        group_codes[valid].astype(np.int64) * code_count + codes[valid],
+        minlength=group_count * code_count,
+    )
+    return table.reshape(group_count, code_count)
+
+
+def get_histogram_relative_error() -> float:
+    """Relative error of latency histograms, from the "histogram" config key."""
+    histogram_config = get_config_value("histogram", {}) or {}
+    relative_error = float(histogram_config.get("relative_error", DEFAULT_RELATIVE_ERROR))
+    if not 0 < relative_error < 1:
+        raise ValueError(f"Histogram relative error out of range (0, 1): {relative_error:g}")
+    return relative_error
+
+
+def get_percentiles() -> list[float]:
+    """Response time percentiles to report, from the "percentiles" config key."""
+    percentiles = [float(p) for p in get_config_value("percentiles", DEFAULT_PERCENTILES)]
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile out of range [0, 100]: {percentile:g}")
+    return percentiles
+
+
+def percentile_name(percentile: float) -> str:
+    return f"p{percentile:g}"
+
+
+def grouped_percentiles(
+    codes: np.ndarray,
+    values: np.ndarray,
+    group_count: int,
+    percentiles: Sequence[float],
+) -> np.ndarray:
+    """Exact percentiles of `values` for every group code, NaN for empty groups."""
+    values = np.asarray(values, dtype=np.float64)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+    result = np.full((group_count, len(percentiles)), np.nan)
+    if not len(values) or not len(percentiles):
+        return result
+    if group_count == 1:
+        sorted_values = np.sort(values)
+    else:
+        # sort by value, then stably by group: cheaper than a two-key lexsort
+        by_value = np.argsort(values, kind="stable")
+        sorted_values = values[by_value[np.argsort(codes[by_value], kind="stable")]]
+    counts = np.bincount(codes, minlength=group_count)
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    ranks = (counts[present, None] - 1) * (np.asarray(percentiles, dtype=np.float64) / 100)
+    lower = np.floor(ranks).astype(np.int64)
+    upper = np.ceil(ranks).astype(np.int64)
+    low_values = sorted_values[starts[present, None] + lower]
+    high_values = sorted_values[starts[present, None] + upper]
+    result[present] = low_values + (high_values - low_values) * (ranks - lower)
+    return result
+
+
 def get_response_time_stats(
-    df_raw: pd.DataFrame, dfs_sorted_by_apis: dict[str, pd.DataFrame]
+    df_raw: pd.DataFrame, api_stats: dict[str, Any]
 ) -> dict[str, Any]:
     return {
         "overall_max": df_raw["elapsed"].max(),
         "overall_min": df_raw["elapsed"].min(),
         "overall_avg": df_raw["elapsed"].mean(),
-        "max_per_group": {api: df["elapsed"].max() for api, df in dfs_sorted_by_apis.items()},
-        "min_per_group": {api: df["elapsed"].min() for api, df in dfs_sorted_by_apis.items()},
-        "avg_per_group": {api: df["elapsed"].mean() for api, df in dfs_sorted_by_apis.items()},
+        "max_per_group": api_stats["elapsed"]["max"],
+        "min_per_group": api_stats["elapsed"]["min"],
+        "avg_per_group": api_stats["elapsed"]["mean"],
     }
 
 
+CPU_UNITS = {"m": 1}
+MEMORY_UNITS = {
+    "Ki": 1024,
+    "Mi": 1024**2,
+    "Gi": 1024**3,
+    "Ti": 1024**4,
+    "Pi": 1024**5,
+    "Ei": 1024**6,
+    "k": 1000,
+    "M": 1000**2,
+    "G": 1000**3,
+    "T": 1000**4,
+}
+
+
 def add_numeric_resource_columns(df_raw: pd.DataFrame) -> pd.DataFrame:
     df = df_raw.copy()
-    df["cpu_mcores"] = df["cpu"].apply(parse_cpu_to_mcores)
-    df["memory_bytes"] = df["memory"].apply(parse_memory_to_bytes)
+    # load_resources_json already delivers the numeric columns
+    if "cpu_mcores" not in df.columns:
+        df["cpu_mcores"] = parse_cpu_column(df["cpu"])
+    if "memory_bytes" not in df.columns:
+        df["memory_bytes"] = parse_memory_column(df["memory"])
     return df
 
 
+def parse_cpu_column(values: Any) -> np.ndarray:
+    """Vectorized `parse_cpu_to_mcores`: each distinct quantity is parsed once."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    return parse_cpu_quantities(uniques)[codes]
+
+
+def parse_memory_column(values: Any) -> np.ndarray:
+    """Vectorized `parse_memory_to_bytes`: each distinct quantity is parsed once."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    return parse_memory_quantities(uniques)[codes]
+
+
+def parse_cpu_quantities(values: Any) -> np.ndarray:
+    """Millicores of each CPU quantity ("250m", "2", 0.5); 0.0 if missing or invalid."""
+    return _parse_quantities(values, CPU_UNITS, 1000)
+
+
+def parse_memory_quantities(values: Any) -> np.ndarray:
+    """Bytes of each memory quantity ("128Mi", "1G", 2048); 0.0 if missing or invalid."""
+    return _parse_quantities(values, MEMORY_UNITS, 1)
+
+
+def _parse_quantities(
+    values: Any, units: dict[str, int], default_multiplier: int
+) -> np.ndarray:
+    """Split Kubernetes quantities into number and suffix with one regex pass."""
+    text = pd.Series(values, dtype=object).astype(str).str.strip()
+    if text.empty:
+        return np.zeros(0)
+    suffixes = "|".join(sorted(units, key=len, reverse=True))
+    parts = text.str.extract(rf"^(.*?)({suffixes})?$")
+    numbers = pd.to_numeric(parts[0].str.strip(), errors="coerce").to_numpy(float)
+    multipliers = parts[1].map(units).fillna(default_multiplier).to_numpy(float)
+    return np.nan_to_num(numbers * multipliers, nan=0.0)
+
+
+def get_snapshot_offsets(timestamps: pd.Series) -> tuple[np.ndarray, Any, Any]:
+    """1-based time order of each row's snapshot, plus the first and last timestamp."""
+    codes, uniques = pd.factorize(timestamps, sort=False)
+    if not len(uniques):
+        return np.zeros(len(timestamps), dtype=np.int64), None, None
+    parsed = pd.to_datetime(
+        pd.Index(uniques).astype(str), utc=True, format="ISO8601", errors="coerce"
+    )
+    keys = np.asarray(uniques, dtype=object) if parsed.hasnans else parsed.asi8
+    ranks = np.unique(keys, return_inverse=True)[1].reshape(-1)
+    order = np.argsort(ranks, kind="stable")
+    offsets = np.where(codes >= 0, ranks[codes] + 1, 0)
+    return offsets, uniques[order[0]], uniques[order[-1]]
+
+
 def parse_cpu_to_mcores(value: Any) -> float:
-    if value is None:
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value) * 1000
-    text = str(value).strip()
-    if text.endswith("m"):
-        return float(text[:-1])
-    try:
-        return float(text) * 1000
-    except ValueError:
-        return 0.0
+    return float(parse_cpu_quantities([value])[0])
 
 
 def parse_memory_to_bytes(value: Any) -> float:
-    if value is None:
-        return 0.0
-    if isinstance(value, (int, float)):
-        return float(value)
-    text = str(value).strip()
-    units = {
-        "Ki": 1024,
-        "Mi": 1024**2,
-        "Gi": 1024**3,
-        "Ti": 1024**4,
-        "Pi": 1024**5,
-        "Ei": 1024**6,
-        "k": 1000,
-        "M": 1000**2,
-        "G": 1000**3,
-        "T": 1000**4,
-    }
-    for suffix, multiplier in units.items():
-        if text.endswith(suffix):
-            try:
-                return float(text[: -len(suffix)]) * multiplier
-            except ValueError:
-                return 0.0
-    try:
-        return float(text)
-    except ValueError:
-        return 0.0
+    return float(parse_memory_quantities([value])[0])
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from os import path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .shared_frames import decode_column, encode_column
+
+CACHE_DIR_NAME = ".reportgen_cache"
+CACHE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+# Bytes hashed from each end of the source file; hashing all of a 20 GB CSV
+# would cost as much as parsing it.
+HASH_SAMPLE_SIZE = 1 << 20
+
+
+def cache_dir_for(file_path: str) -> str:
+    """Return the sidecar cache directory of one parsed file."""
+    directory, filename = path.split(file_path)
+    return path.join(directory, CACHE_DIR_NAME, filename)
+
+
+def source_fingerprint(file_path: str) -> dict[str, Any]:
+    """Identify the current content of `file_path` cheaply."""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(HASH_SAMPLE_SIZE))
+        if stat.st_size > 2 * HASH_SAMPLE_SIZE:
+            f.seek(-HASH_SAMPLE_SIZE, os.SEEK_END)
+            digest.update(f.read(HASH_SAMPLE_SIZE))
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample_hash": digest.hexdigest(),
+    }
+
+
+def load_cached_frame(file_path: str, variant: dict[str, Any]) -> pd.DataFrame | None:
+    """Return the memory-mapped cached frame for `file_path`, or None when missing/stale."""
+    directory = cache_dir_for(file_path)
+    try:
+        with open(path.join(directory, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        manifest.get("version") != CACHE_FORMAT_VERSION
+        or manifest.get("variant") != variant
+        or manifest.get("source") != source_fingerprint(file_path)
+    ):
+        return None
+    data: dict[str, Any] = {}
+    try:
+        for column in manifest["columns"]:
+            # plain ndarray view over the mapping, not the np.memmap subclass
+            values = np.asarray(
+                np.load(path.join(directory, column["file"]), mmap_mode="r")
+            )
+            data[column["name"]] = decode_column(
+                column["kind"], values, column["uniques"], column["original_dtype"]
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+    return pd.DataFrame(data, index=pd.RangeIndex(manifest["length"]), copy=False)
+
+
+def store_cached_frame(file_path: str, variant: dict[str, Any], df: pd.DataFrame) -> bool:
+    """Write `df` as the sidecar cache of `file_path`; False when it cannot be stored."""
+    directory = cache_dir_for(file_path)
+    columns: list[dict[str, Any]] = []
+    try:
+        fingerprint = source_fingerprint(file_path)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+        for index, name in enumerate(df.columns):
+            kind, values, uniques = encode_column(df[name])
+            filename = f"{index}.npy"
+            np.save(path.join(directory, filename), np.ascontiguousarray(values))
+            columns.append(
+                {
+                    "name": str(name),
+                    "kind": kind,
+                    "file": filename,
+                    "uniques": uniques,
+                    "original_dtype": str(df[name].dtype),
+                }
+            )
+        manifest = {
+            "version": CACHE_FORMAT_VERSION,
+            "source": fingerprint,
+            "variant": variant,
+            "length": len(df),
+            "columns": columns,
+        }
+        # the manifest is written last and atomically, so readers never see
+        # a half-written cache as valid
+        tmp_path = path.join(directory, f"{MANIFEST_NAME}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path.join(directory, MANIFEST_NAME))
+    except (OSError, TypeError, ValueError):
+        shutil.rmtree(directory, ignore_errors=True)
+        return False
+    return True
+
+
+def purge_cache(requests_dir: str) -> int:
+    """Delete every sidecar cache under `requests_dir`; return how many."""
+    removed = 0
+    for root, dirs, _ in os.walk(requests_dir):
+        if CACHE_DIR_NAME in dirs:
+            shutil.rmtree(path.join(root, CACHE_DIR_NAME), ignore_errors=True)
+            dirs.remove(CACHE_DIR_NAME)
+            removed += 1
+    return removed
@@ -3,7 +3,9 @@ from __future__ import annotations
 import argparse
 import pathlib
 
+from .cache import CACHE_DIR_NAME
 from .config_store import default_config_path
+from .loader import CSV_ENGINES, generator_names
 
 
 def _abs_path(value: str | pathlib.Path) -> pathlib.Path:
@@ -11,9 +13,16 @@ def _abs_path(value: str | pathlib.Path) -> pathlib.Path:
     return pathlib.Path(value).expanduser().resolve()
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="API performance report generator")
-    parser.add_argument("-g", "--generator", choices=["jmeter", "k6"], required=True)
+    parser.add_argument("-g", "--generator", choices=generator_names(), required=True)
     parser.add_argument(
         "-c",
         "--config",
@@ -27,7 +36,8 @@ def parse_args():
         "--results_dir",
         required=True,
         type=_abs_path,
-        help="Directory containing the results CSV and resource usage JSON files.",
+        help="Directory containing the results and resource usage JSON files "
+        "(optionally .gz/.bz2/.xz compressed).",
     )
     # Not required since dry runs may not produce an output file
     parser.add_argument("-o", "--output", required=False, type=_abs_path)
@@ -40,4 +50,75 @@ def parse_args():
         help="Directory to save generated plot images (default: ./plots)",
     )
     parser.add_argument("-d", "--dry-run", required=False, action="store_true")
+    parser.add_argument(
+        "--chunk-size",
+        required=False,
+        type=_positive_int,
+        default=None,
+        help="Stream results files in chunks of this many rows instead of "
+        "loading them whole (bounds memory on very large files).",
+    )
+    parser.add_argument(
+        "--compact",
+        required=False,
+        action="store_true",
+        help="Read only the columns the analyzer uses, with compact dtypes "
+        "(categorical labels/response codes, int32 elapsed).",
+    )
+    parser.add_argument(
+        "--csv-engine",
+        required=False,
+        choices=CSV_ENGINES,
+        default=None,
+        help="pandas CSV engine for JMeter and k6 CSVs; 'auto' uses pyarrow when it "
+        "is installed. Gatling logs, Locust histories and --chunk-size reads always "
+        "use the C parser.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=_positive_int,
+        default=1,
+        help="Number of processes used to parse results files (default: 1). "
+        "Not used together with --chunk-size.",
+    )
+    parser.add_argument(
+        "--analysis-jobs",
+        required=False,
+        type=_positive_int,
+        default=None,
+        help="Number of processes used to analyze tests (default: --jobs). "
+        "Not used together with --chunk-size.",
+    )
+    parser.add_argument(
+        "--include",
+        required=False,
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Only report tests whose 'suite.test' name matches this glob "
+        "(repeatable; root level tests are '__root__.<test>').",
+    )
+    parser.add_argument(
+        "--exclude",
+        required=False,
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Skip tests whose 'suite.test' name matches this glob (repeatable).",
+    )
+    parser.add_argument(
+        "--cache",
+        required=False,
+        action="store_true",
+        help="Keep a binary sidecar cache of every parsed results file in a "
+        f"{CACHE_DIR_NAME} directory next to it and reuse it on later runs.",
+    )
+    parser.add_argument(
+        "--purge-cache",
+        required=False,
+        action="store_true",
+        help="Delete all sidecar caches under the results directory before loading.",
+    )
     return parser.parse_args()
@@ -5,6 +5,7 @@ import pathlib
 from typing import Any, Optional
 
 _cached_config: dict[str, Any] | None = None
+DEFAULT_ROLLING_WINDOWS = [10, 60]
 
 
 def default_config_path() -> pathlib.Path:
@@ -27,6 +28,12 @@ def load_config(path: Optional[str | pathlib.Path] = None) -> dict[str, Any] | N
     return _cached_config
 
 
+def set_config(config: dict[str, Any]) -> None:
+    """Install an already loaded config, e.g. in a worker process."""
+    global _cached_config
+    _cached_config = config
+
+
 def get_config() -> dict[str, Any]:
     """Return cached config, loading from the last known path if needed."""
     if _cached_config is None:
@@ -40,6 +47,15 @@ def get_config_value(key: str, default: Any = None) -> Any:
     return get_config().get(key, default)
 
 
+def get_rolling_windows() -> list[int]:
+    """Sliding window lengths in seconds, from the "rolling_windows_in_seconds" key."""
+    windows = [int(w) for w in get_config_value("rolling_windows_in_seconds", DEFAULT_ROLLING_WINDOWS)]
+    for window in windows:
+        if window <= 0:
+            raise ValueError(f"Rolling window must be a positive number of seconds: {window}")
+    return windows
+
+
 def get_storage_config() -> dict[str, Any]:
     """Return storage config with defaults applied."""
     cfg = get_config()
@@ -5,18 +5,31 @@ import os
 import html
 import re
 import datetime as dt
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Sequence
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from .config_store import get_config_value
+from .results import SecondSeries
 from .storage import load_history
 import base64
 from io import BytesIO
+import numpy as np
+
+ERROR_CLASS_COLORS = {
+    "2xx": "#5cb85c",
+    "3xx": "#5bc0de",
+    "4xx": "#f0ad4e",
+    "5xx": "#d9534f",
+    "other": "#777777",
+}
 
 
 def _series_from_second_map(
-    data_map: Dict[Any, Any]
-) -> tuple[list[int], list[float]]:
+    data_map: Mapping[Any, Any]
+) -> tuple[Sequence[int], Sequence[float]]:
+    if isinstance(data_map, SecondSeries):
+        return data_map.seconds, data_map.array
     if not data_map:
         return [], []
     series: list[tuple[int, float]] = []
@@ -73,9 +86,20 @@ def plot_tps_over_time(
     seconds, tps_values = _series_from_second_map(tps_by_second)
     fig, ax = plt.subplots(figsize=(8, 4))
     marker_style = "o" if duration <= 120 else None
-    ax.plot(seconds, tps_values, marker=marker_style, linewidth=1.4)
-    if duration > 0 and seconds:
-        ax.set_xlim(1, max(seconds))
+    ax.plot(seconds, tps_values, marker=marker_style, linewidth=1.4, label="per second")
+    _plot_rolling_series(ax, result, "transactions_per_second")
+    steady_state = result.get("steady_state")
+    if steady_state and steady_state.get("detected"):
+        ax.axvspan(
+            steady_state["start_offset"],
+            steady_state["end_offset"],
+            color="#5cb85c",
+            alpha=0.1,
+            label="steady state",
+        )
+        ax.legend(loc="best", fontsize=8)
+    if duration > 0 and len(seconds):
+        ax.set_xlim(1, seconds[-1])
     ax.set_ylim(0, get_config_value("target_tps", 100))
     ax.set_xlabel("Second")
     ax.set_ylabel("Transactions")
@@ -96,8 +120,8 @@ def plot_errors_over_time(
     seconds, err_values = _series_from_second_map(err_map)
     fig, ax = plt.subplots(figsize=(8, 4))
     ax.bar(seconds, err_values, color="#d9534f")
-    if duration > 0 and seconds:
-        ax.set_xlim(1, max(seconds))
+    if duration > 0 and len(seconds):
+        ax.set_xlim(1, seconds[-1])
     ax.set_xlabel("Second")
     ax.set_ylabel("Errors")
     ax.set_title(title or f"Errors Over Time: {result.get('test_name', 'unknown')}")
@@ -105,6 +129,41 @@ def plot_errors_over_time(
     return fig
 
 
+def plot_errors_by_code_class_over_time(
+    result: Dict[str, Any], *, title: Optional[str] = None
+) -> Figure:
+    """Failed requests per second, stacked by response code class."""
+    if not is_transaction_result(result):
+        return _empty_fig("No error data")
+    by_class: Dict[str, Any] = result.get("error_count_per_second_by_class", {})
+    if not by_class:
+        return _empty_fig("No errors")
+    fig, ax = plt.subplots(figsize=(8, 4))
+    bottom = None
+    for code_class, per_second in sorted(by_class.items()):
+        seconds, values = _series_from_second_map(per_second)
+        values = np.asarray(values, dtype=float)
+        ax.bar(
+            seconds,
+            values,
+            bottom=bottom,
+            width=1.0,
+            color=ERROR_CLASS_COLORS.get(code_class),
+            label=code_class,
+        )
+        bottom = values if bottom is None else bottom + values
+    if len(seconds):
+        ax.set_xlim(seconds[0] - 0.5, seconds[-1] + 0.5)
+    ax.set_xlabel("Second")
+    ax.set_ylabel("Errors")
+    ax.set_title(
+        title or f"Errors by Response Code Class: {result.get('test_name', 'unknown')}"
+    )
+    ax.legend(loc="best", fontsize=8)
+    ax.grid(axis="y", linestyle="--", alpha=0.4)
+    return fig
+
+
 def plot_avg_response_time_over_time(
     result: Dict[str, Any], *, title: Optional[str] = None
 ) -> Figure:
@@ -117,9 +176,12 @@ def plot_avg_response_time_over_time(
     seconds, avg_values = _series_from_second_map(avg_map)
     fig, ax = plt.subplots(figsize=(8, 4))
     marker_style = "o" if duration <= 120 else None
-    ax.plot(seconds, avg_values, marker=marker_style, linewidth=1.4, color="#5bc0de")
-    if duration > 0 and seconds:
-        ax.set_xlim(1, max(seconds))
+    ax.plot(
+        seconds, avg_values, marker=marker_style, linewidth=1.4, color="#5bc0de", label="per second"
+    )
+    _plot_rolling_series(ax, result, "avg_response_time")
+    if duration > 0 and len(seconds):
+        ax.set_xlim(1, seconds[-1])
     ax.set_xlabel("Second")
     ax.set_ylabel("Avg Response Time (ms)")
     ax.set_title(
@@ -129,6 +191,85 @@ def plot_avg_response_time_over_time(
     return fig
 
 
+def _plot_rolling_series(ax: Axes, result: Dict[str, Any], metric: str) -> None:
+    """Overlay the sliding-window series of `metric` as dashed lines."""
+    rolling: Dict[int, Dict[str, Any]] = result.get("rolling_windows", {})
+    for window, metrics in sorted(rolling.items()):
+        seconds, values = _series_from_second_map(metrics.get(metric, {}))
+        if len(seconds):
+            ax.plot(seconds, values, linestyle="--", linewidth=1.2, label=f"{window}s window")
+    if rolling:
+        ax.legend(loc="best", fontsize=8)
+
+
+def plot_response_time_percentiles_over_time(
+    result: Dict[str, Any], *, title: Optional[str] = None
+) -> Figure:
+    if not is_transaction_result(result):
+        return _empty_fig("No response time data")
+    percentile_maps: Dict[str, Dict[int, float]] = result.get(
+        "response_time_percentiles_per_second", {}
+    )
+    duration = int(result.get("test_duration_in_seconds", 0))
+    if not percentile_maps or duration <= 0:
+        return _empty_fig("No percentile data")
+    fig, ax = plt.subplots(figsize=(8, 4))
+    marker_style = "o" if duration <= 120 else None
+    max_second = 0
+    for name, per_second in percentile_maps.items():
+        seconds, values = _series_from_second_map(per_second)
+        ax.plot(seconds, values, marker=marker_style, linewidth=1.2, label=name)
+        if len(seconds):
+            max_second = max(max_second, int(seconds[-1]))
+    if max_second:
+        ax.set_xlim(1, max_second)
+    ax.set_xlabel("Second")
+    ax.set_ylabel("Response Time (ms)")
+    ax.set_title(
+        title
+        or f"Response Time Percentiles Over Time: {result.get('test_name', 'unknown')}"
+    )
+    ax.legend()
+    ax.grid(True, linestyle="--", alpha=0.4)
+    return fig
+
+
+def plot_response_time_percentiles_by_api(
+    result: Dict[str, Any], *, title: Optional[str] = None
+) -> Figure:
+    if not is_transaction_result(result):
+        return _empty_fig("No response time data")
+    percentile_maps: Dict[str, Dict[str, float]] = result.get(
+        "response_time_percentiles_per_api", {}
+    )
+    apis = sorted({api for per_api in percentile_maps.values() for api in per_api})
+    if not apis:
+        return _empty_fig("No percentile data")
+
+    x = range(len(apis))
+    width = 0.8 / len(percentile_maps)
+    fig, ax = plt.subplots(figsize=(max(8, len(apis) * 0.6), 5))
+    for index, (name, per_api) in enumerate(percentile_maps.items()):
+        offset = (index - (len(percentile_maps) - 1) / 2) * width
+        ax.bar(
+            [i + offset for i in x],
+            [per_api.get(a, math.nan) for a in apis],
+            width=width,
+            label=name,
+        )
+
+    ax.set_xticks(list(x))
+    ax.set_xticklabels(apis, rotation=45, ha="right")
+    ax.set_ylabel("Response Time (ms)")
+    ax.set_title(
+        title or f"Response Time Percentiles by API: {result.get('test_name', 'unknown')}"
+    )
+    ax.legend()
+    ax.grid(axis="y", linestyle="--", alpha=0.35)
+    fig.tight_layout()
+    return fig
+
+
 def plot_response_times_by_api(
     result: Dict[str, Any], *, title: Optional[str] = None
 ) -> Figure:
@@ -295,12 +436,21 @@ def create_and_save_graphs(
         figures: list[tuple[Figure, str]] = [
             (plot_tps_over_time(result), "TPS Over Time"),
             (plot_errors_over_time(result), "Errors Over Time"),
+            (plot_errors_by_code_class_over_time(result), "Errors by Response Code Class"),
             (plot_avg_response_time_over_time(result), "Avg Response Time Over Time"),
+            (
+                plot_response_time_percentiles_over_time(result),
+                "Response Time Percentiles Over Time",
+            ),
         ]
         if multi_api_enabled:
             figures.extend(
                 [
                     (plot_response_times_by_api(result), "Response Times by API"),
+                    (
+                        plot_response_time_percentiles_by_api(result),
+                        "Response Time Percentiles by API",
+                    ),
                     (plot_error_rate_by_api(result), "Error Rate by API"),
                 ]
             )
@@ -364,7 +514,10 @@ def create_and_save_graphs(
 __all__ = [
     "plot_tps_over_time",
     "plot_errors_over_time",
+    "plot_errors_by_code_class_over_time",
     "plot_avg_response_time_over_time",
+    "plot_response_time_percentiles_over_time",
+    "plot_response_time_percentiles_by_api",
     "plot_response_times_by_api",
     "plot_error_rate_by_api",
     "plot_tps_vs_resource_usage",
@@ -568,8 +721,8 @@ def _render_dashboard(
 
 
 def _plot_metric_with_resources(
-    metric_seconds: list[int],
-    metric_values: list[float],
+    metric_seconds: Sequence[int],
+    metric_values: Sequence[float],
     cpu_seconds: list[int],
     cpu_values: list[float],
     mem_seconds: list[int],
@@ -582,11 +735,11 @@ def _plot_metric_with_resources(
     has_cpu = _has_valid_data(cpu_values)
     has_mem = _has_valid_data(mem_values)
 
-    if not metric_values or (not has_cpu and not has_mem):
+    if not len(metric_values) or (not has_cpu and not has_mem):
         return _empty_fig("No overlapping data")
 
     max_time = max(
-        [metric_seconds[-1] if metric_seconds else 0]
+        [metric_seconds[-1] if len(metric_seconds) else 0]
         + ([max(cpu_seconds)] if has_cpu and cpu_seconds else [])
         + ([max(mem_seconds)] if has_mem and mem_seconds else [])
     )
@@ -674,11 +827,11 @@ def plot_tps_vs_resource_usage(
     has_cpu = _has_valid_data(cpu_values)
     has_mem = _has_valid_data(mem_values)
 
-    if not tps_values or (not has_cpu and not has_mem):
+    if not len(tps_values) or (not has_cpu and not has_mem):
         return _empty_fig("No overlapping TPS/resource data")
 
     max_time = max(
-        [tps_seconds[-1] if tps_seconds else 0]
+        [tps_seconds[-1] if len(tps_seconds) else 0]
         + ([max(cpu_seconds)] if cpu_seconds else [])
         + ([max(mem_seconds)] if mem_seconds else [])
     )
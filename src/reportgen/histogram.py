@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import base64
+import math
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+DEFAULT_RELATIVE_ERROR = 0.01
+# bucket_indexes value of values <= 0; sorts before every real bucket
+ZERO_BUCKET = np.iinfo(np.int64).min
+# windows per dense table in sliding_sparse_percentiles
+SLIDING_BLOCK_SIZE = 4096
+
+
+@dataclass
+class LatencyHistogram:
+    """Log-bucketed latency histogram with a bounded relative error; merges by adding counts."""
+
+    relative_error: float = DEFAULT_RELATIVE_ERROR
+    # counts[k] is bucket offset + k
+    offset: int = 0
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    zero_count: int = 0
+    min_value: float = math.inf
+    max_value: float = -math.inf
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.relative_error) / (1 - self.relative_error)
+
+    @property
+    def total_count(self) -> int:
+        return int(self.counts.sum()) + self.zero_count
+
+    @classmethod
+    def from_values(
+        cls, values: Any, relative_error: float = DEFAULT_RELATIVE_ERROR
+    ) -> "LatencyHistogram":
+        values = np.asarray(values, dtype=np.float64)
+        return grouped_histograms(
+            np.zeros(len(values), dtype=np.int64), values, 1, relative_error
+        )[0]
+
+    @classmethod
+    def from_buckets(
+        cls,
+        buckets: Any,
+        counts: Any,
+        relative_error: float = DEFAULT_RELATIVE_ERROR,
+        min_value: float = math.inf,
+        max_value: float = -math.inf,
+    ) -> "LatencyHistogram":
+        """Histogram of `bucket_indexes` buckets (ZERO_BUCKET included) and their counts."""
+        buckets = np.asarray(buckets, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        zero = buckets == ZERO_BUCKET
+        histogram = cls(
+            relative_error,
+            zero_count=int(counts[zero].sum()),
+            min_value=float(min_value),
+            max_value=float(max_value),
+        )
+        buckets, counts = buckets[~zero], counts[~zero]
+        if len(buckets):
+            histogram.offset = int(buckets.min())
+            histogram.counts = np.zeros(int(buckets.max()) - histogram.offset + 1, dtype=np.int64)
+            np.add.at(histogram.counts, buckets - histogram.offset, counts)
+        return histogram
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Return a new histogram holding the samples of both."""
+        if not math.isclose(self.relative_error, other.relative_error):
+            raise ValueError(
+                "Cannot merge histograms with relative errors "
+                f"{self.relative_error:g} and {other.relative_error:g}"
+            )
+        if not len(other.counts) or not len(self.counts):
+            counts, offset = (
+                (self.counts, self.offset) if len(self.counts) else (other.counts, other.offset)
+            )
+        else:
+            offset = min(self.offset, other.offset)
+            end = max(self.offset + len(self.counts), other.offset + len(other.counts))
+            counts = np.zeros(end - offset, dtype=np.int64)
+            counts[self.offset - offset : self.offset - offset + len(self.counts)] += self.counts
+            counts[other.offset - offset : other.offset - offset + len(other.counts)] += other.counts
+        return LatencyHistogram(
+            relative_error=self.relative_error,
+            offset=offset,
+            counts=counts.copy(),
+            zero_count=self.zero_count + other.zero_count,
+            min_value=min(self.min_value, other.min_value),
+            max_value=max(self.max_value, other.max_value),
+        )
+
+    def percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        """Value at each percentile (0-100), NaN when the histogram is empty."""
+        total = self.total_count
+        if not total:
+            return [math.nan] * len(percentiles)
+        cumulative = np.cumsum(self.counts) + self.zero_count
+        gamma = self.gamma
+        results: list[float] = []
+        for percentile in percentiles:
+            rank = int(percentile / 100 * (total - 1))
+            if rank < self.zero_count:
+                value = min(0.0, self.max_value)
+            else:
+                index = int(np.searchsorted(cumulative, rank, side="right"))
+                # midpoint (in relative terms) of the bucket's bounds
+                value = 2 * gamma ** (self.offset + index) / (gamma + 1)
+            results.append(float(min(max(value, self.min_value), self.max_value)))
+        return results
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compact JSON-serializable form; see `from_dict`."""
+        return {
+            "relative_error": self.relative_error,
+            "offset": self.offset,
+            "counts": base64.b64encode(
+                zlib.compress(self.counts.astype("<i8").tobytes())
+            ).decode("ascii"),
+            "zero_count": self.zero_count,
+            "min": self.min_value if self.total_count else None,
+            "max": self.max_value if self.total_count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        counts = np.frombuffer(
+            zlib.decompress(base64.b64decode(data["counts"])), dtype="<i8"
+        ).astype(np.int64)
+        return cls(
+            relative_error=float(data["relative_error"]),
+            offset=int(data["offset"]),
+            counts=counts,
+            zero_count=int(data["zero_count"]),
+            min_value=math.inf if data.get("min") is None else float(data["min"]),
+            max_value=-math.inf if data.get("max") is None else float(data["max"]),
+        )
+
+
+def merge_histograms(histograms: Iterable[LatencyHistogram]) -> LatencyHistogram | None:
+    """Merge any number of histograms; None when there are none."""
+    merged: LatencyHistogram | None = None
+    for histogram in histograms:
+        merged = histogram if merged is None else merged.merge(histogram)
+    return merged
+
+
+def grouped_histograms(
+    codes: np.ndarray,
+    values: Any,
+    group_count: int,
+    relative_error: float = DEFAULT_RELATIVE_ERROR,
+) -> list[LatencyHistogram]:
+    """Build one histogram per group code with a single bincount."""
+    codes, values = _valid_samples(codes, values)
+    histograms = [LatencyHistogram(relative_error) for _ in range(group_count)]
+    if not len(values):
+        return histograms
+
+    minimums = np.full(group_count, math.inf)
+    maximums = np.full(group_count, -math.inf)
+    np.minimum.at(minimums, codes, values)
+    np.maximum.at(maximums, codes, values)
+    offset, table = histogram_table(codes, values, group_count, relative_error)
+
+    for code, histogram in enumerate(histograms):
+        row = table[code, 1:]
+        used = np.flatnonzero(row)
+        if len(used):
+            histogram.offset = offset + int(used[0])
+            histogram.counts = row[used[0] : used[-1] + 1].astype(np.int64)
+        histogram.zero_count = int(table[code, 0])
+        histogram.min_value = float(minimums[code])
+        histogram.max_value = float(maximums[code])
+    return histograms
+
+
+def histogram_table(
+    codes: np.ndarray,
+    values: Any,
+    group_count: int,
+    relative_error: float = DEFAULT_RELATIVE_ERROR,
+) -> tuple[int, np.ndarray]:
+    """Bucket counts of every group as one (group_count, width) array; column 0 counts values <= 0."""
+    codes, values = _valid_samples(codes, values)
+    positive = values > 0
+    indexes = bucket_indexes(values[positive], relative_error)
+    if not len(indexes):
+        return 0, np.bincount(codes, minlength=group_count).reshape(group_count, 1)
+    offset = int(indexes.min())
+    width = int(indexes.max()) - offset + 2
+    columns = np.zeros(len(values), dtype=np.int64)
+    columns[positive] = indexes - offset + 1
+    table = np.bincount(codes * width + columns, minlength=group_count * width)
+    return offset, table.reshape(group_count, width)
+
+
+def table_percentiles(
+    offset: int,
+    table: np.ndarray,
+    percentiles: Sequence[float],
+    relative_error: float = DEFAULT_RELATIVE_ERROR,
+) -> np.ndarray:
+    """Percentiles of every row of a `histogram_table`, NaN for empty rows."""
+    gamma = (1 + relative_error) / (1 - relative_error)
+    cumulative = np.cumsum(table, axis=1)
+    totals = cumulative[:, -1]
+    bucket_values = np.concatenate(
+        ([0.0], 2 * gamma ** (offset + np.arange(table.shape[1] - 1)) / (gamma + 1))
+    )
+    result = np.full((len(table), len(percentiles)), np.nan)
+    present = totals > 0
+    for i, percentile in enumerate(percentiles):
+        ranks = np.floor(percentile / 100 * (totals[present] - 1))
+        columns = (cumulative[present] > ranks[:, None]).argmax(axis=1)
+        result[present, i] = bucket_values[columns]
+    return result
+
+
+def bucket_indexes(values: Any, relative_error: float = DEFAULT_RELATIVE_ERROR) -> np.ndarray:
+    """Histogram bucket of every value, ZERO_BUCKET for values <= 0."""
+    values = np.asarray(values, dtype=np.float64)
+    indexes = np.full(len(values), ZERO_BUCKET, dtype=np.int64)
+    positive = values > 0
+    log_gamma = math.log((1 + relative_error) / (1 - relative_error))
+    indexes[positive] = np.ceil(np.log(values[positive]) / log_gamma)
+    return indexes
+
+
+def bucket_values(
+    buckets: np.ndarray, relative_error: float = DEFAULT_RELATIVE_ERROR
+) -> np.ndarray:
+    """Value read back from each bucket: 0.0 for ZERO_BUCKET, else its relative midpoint."""
+    gamma = (1 + relative_error) / (1 - relative_error)
+    values = np.zeros(len(buckets))
+    positive = buckets != ZERO_BUCKET
+    values[positive] = 2 * gamma ** buckets[positive].astype(np.float64) / (gamma + 1)
+    return values
+
+
+def sparse_histograms(
+    codes: np.ndarray, values: Any, relative_error: float = DEFAULT_RELATIVE_ERROR
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-group histograms as their non-empty (code, bucket) pairs and counts."""
+    codes, values = _valid_samples(codes, values)
+    return merge_sparse_histograms(
+        codes.astype(np.int64),
+        bucket_indexes(values, relative_error),
+        np.ones(len(values), dtype=np.int64),
+    )
+
+
+def merge_sparse_histograms(
+    codes: np.ndarray, buckets: np.ndarray, counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sum the counts of equal (code, bucket) pairs, sorted by code, then bucket."""
+    if not len(codes):
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty.copy(), empty.copy()
+    order = np.lexsort((buckets, codes))
+    codes, buckets, counts = codes[order], buckets[order], counts[order]
+    starts = np.flatnonzero(
+        np.concatenate(([True], (codes[1:] != codes[:-1]) | (buckets[1:] != buckets[:-1])))
+    )
+    return codes[starts], buckets[starts], np.add.reduceat(counts, starts)
+
+
+def sparse_percentiles(
+    codes: np.ndarray,
+    buckets: np.ndarray,
+    counts: np.ndarray,
+    group_count: int,
+    percentiles: Sequence[float],
+    relative_error: float = DEFAULT_RELATIVE_ERROR,
+) -> np.ndarray:
+    """Percentiles of every group of sorted `sparse_histograms` pairs, NaN for empty groups."""
+    result = np.full((group_count, len(percentiles)), np.nan)
+    if not len(codes):
+        return result
+    cumulative = np.cumsum(counts)
+    totals = np.bincount(codes, weights=counts, minlength=group_count).astype(np.int64)
+    before = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    values = bucket_values(buckets, relative_error)
+    present = np.flatnonzero(totals)
+    for i, percentile in enumerate(percentiles):
+        ranks = np.floor(percentile / 100 * (totals[present] - 1)).astype(np.int64)
+        positions = np.searchsorted(cumulative, before[present] + ranks, side="right")
+        result[present, i] = values[positions]
+    return result
+
+
+def sliding_sparse_percentiles(
+    codes: np.ndarray,
+    buckets: np.ndarray,
+    counts: np.ndarray,
+    group_count: int,
+    window: int,
+    percentiles: Sequence[float],
+    relative_error: float = DEFAULT_RELATIVE_ERROR,
+) -> np.ndarray:
+    """Percentiles over trailing windows of sorted `sparse_histograms` groups."""
+    result = np.full((group_count, len(percentiles)), np.nan)
+    if not len(codes):
+        return result
+    positive = buckets != ZERO_BUCKET
+    offset = int(buckets[positive].min()) if positive.any() else 0
+    # column 0 is the zero bucket, like histogram_table
+    columns = np.zeros(len(buckets), dtype=np.int64)
+    columns[positive] = buckets[positive] - offset + 1
+    width = int(columns.max()) + 1
+    for start in range(0, group_count, SLIDING_BLOCK_SIZE):
+        end = min(start + SLIDING_BLOCK_SIZE, group_count)
+        first = max(start - window + 1, 0)
+        low, high = np.searchsorted(codes, [first, end])
+        # row 0 stays empty so prefix[k] sums groups first..first + k - 1
+        prefix = np.zeros((end - first + 1, width), dtype=np.int64)
+        prefix[codes[low:high] - first + 1, columns[low:high]] = counts[low:high]
+        np.cumsum(prefix, axis=0, out=prefix)
+        ends = np.arange(start, end) + 1
+        starts = np.maximum(ends - window, 0)
+        result[start:end] = table_percentiles(
+            offset, prefix[ends - first] - prefix[starts - first], percentiles, relative_error
+        )
+    return result
+
+
+def _valid_samples(codes: np.ndarray, values: Any) -> tuple[np.ndarray, np.ndarray]:
+    values = np.asarray(values, dtype=np.float64)
+    keep = (codes >= 0) & ~np.isnan(values)
+    return codes[keep], values[keep]
@@ -1,15 +1,176 @@
+import numpy as np
 import pandas as pd
-from os import path, listdir
+from os import path
+import bz2
+import csv
+import gzip
+import importlib.util
 import json
-from typing import Any, Dict
-from .config_store import load_config
+import lzma
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from xml.etree import ElementTree
+from pandas.tseries.api import guess_datetime_format
+from typing import IO, Any, Callable, Dict, Iterator, Mapping, Sequence
+from .analyzer import parse_cpu_quantities, parse_memory_quantities
+from .cache import CACHE_DIR_NAME, load_cached_frame, store_cached_frame
+from .config_store import get_config_value, load_config
+from .shared_frames import (
+    SharedFrame,
+    export_frame,
+    import_frame,
+    share_tracker_with_workers,
+)
+
+DEFAULT_CHUNK_SIZE = 200_000
+# Bump whenever parsing or normalization changes the frames produced, so
+# sidecar caches written by older code are not reused.
+NORMALIZATION_VERSION = 1
+# Chunk size of readers that drop rows chunk by chunk while reading a whole
+# file (k6 metrics other than http_req_duration, non-REQUEST Gatling records).
+FILTERED_READ_CHUNK_SIZE = 500_000
+
+# Columns the analyzer actually uses, and the compact dtypes they are read as.
+RESULT_COLUMNS = ["label", "timeStamp", "elapsed", "success", "responseCode"]
+RESULT_DTYPES = {
+    "label": "category",
+    "timeStamp": "int64",
+    "elapsed": "int32",
+    "success": "bool",
+    "responseCode": "category",
+}
+K6_COLUMNS = ["metric_name", "timestamp", "metric_value", "method", "url", "status"]
+K6_DTYPES = {"metric_name": "category", "metric_value": "float64"}
+CSV_ENGINES = ["auto", "c", "pyarrow", "python"]
+RESOURCE_SUFFIX = "_resources.json"
+# Decompressed on the fly; pandas infers the same suffixes for CSVs.
+COMPRESSION_OPENERS: dict[str, Callable[..., IO[str]]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+COMPRESSION_SUFFIXES = tuple(COMPRESSION_OPENERS)
+RESOURCE_COLUMNS = [
+    "timestamp",
+    "podname",
+    "namespace",
+    "container",
+    "cpu_mcores",
+    "memory_bytes",
+]
+JSON_READ_BLOCK_SIZE = 1 << 20
+# Leading bytes read to recognise results files with generic extensions.
+SNIFF_SIZE = 4096
+JTL_SAMPLE_TAGS = ("httpSample", "sample")
+# `<test>.node1.csv`, `<test>.shard2.csv`: one results file per load generator
+SHARD_PATTERN = re.compile(r"^(?P<test>.+)\.(?P<shard>(?:node|shard)\d+)$")
+
+# Formatted JMeter `timeStamp` values (timestamp_format), tried in order.
+TIMESTAMP_FORMATS = (
+    "%Y/%m/%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%m/%d/%Y %H:%M:%S.%f",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S.%f",
+    "%d/%m/%Y %H:%M:%S",
+)
+EPOCH_MS_FORMAT = "ms"
+TIMESTAMP_SAMPLE_SIZE = 1000
+_EPOCH = pd.Timestamp(0, tz="UTC")
+
+# Gatling's text simulation.log: every record type is read into these columns
+GATLING_COLUMNS = ["record", "group", "name", "start", "end", "status", "message"]
+# failed checks read "status.find.in(200,...), but actually found 500"
+_GATLING_FOUND_CODE = r"found (\d{3})\b"
+LOCUST_COLUMNS = [
+    "Timestamp",
+    "Type",
+    "Name",
+    "Total Request Count",
+    "Total Failure Count",
+    "Total Average Response Time",
+]
+
+# Fields pulled straight out of k6 `--out json` lines, see iter_k6_json_chunks.
+_K6_JSON_POINT = re.compile(r'"type"\s*:\s*"Point"')
+_K6_JSON_TYPE = re.compile(r'"type"\s*:\s*"(?:Metric|Point)"')
+_K6_JSON_DURATION = re.compile(r'"metric"\s*:\s*"http_req_duration"')
+_K6_JSON_VALUE = re.compile(r'"value"\s*:\s*(-?[0-9][0-9.eE+-]*)')
+_K6_JSON_FIELDS = {
+    name: re.compile(rf'"{name}"\s*:\s*"((?:[^"\\]|\\.)*)"')
+    for name in ("time", "method", "url", "status")
+}
+
+
+@dataclass(frozen=True)
+class ReadOptions:
+    """How results files are parsed and which tests are read."""
+
+    compact: bool = False
+    engine: str | None = None
+    cache: bool = False
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class GeneratorFormat:
+    """How the results files of one load generator are found and parsed."""
+
+    name: str
+    extensions: tuple[str, ...]
+    iter_chunks: Callable[[str, int | None, ReadOptions], Iterator[pd.DataFrame]]
+    name_pattern: re.Pattern[str] | None = None
+    csv_columns: tuple[str, ...] | None = None
+    csv_dtypes: Mapping[str, str] | None = None
+    normalize: Callable[[pd.DataFrame], pd.DataFrame] | None = None
+    sniffed_extensions: tuple[str, ...] = ()
+    sniff: Callable[[str], bool] | None = None
+
+
+# Filled in by register_generator; the built-in formats are registered at the
+# end of this module.
+GENERATOR_FORMATS: dict[str, GeneratorFormat] = {}
+
+
+def register_generator(generator: GeneratorFormat) -> GeneratorFormat:
+    """Make a results format available to the loader and to `-g`."""
+    GENERATOR_FORMATS[generator.name] = generator
+    return generator
+
+
+def get_generator(name: str) -> GeneratorFormat:
+    try:
+        return GENERATOR_FORMATS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown generator '{name}', expected one of: {', '.join(GENERATOR_FORMATS)}"
+        ) from None
+
+
+def generator_names() -> list[str]:
+    return list(GENERATOR_FORMATS)
 
 
 def load(
-    requests_dir: str, generator_type: str, config_path: str | None = None
+    requests_dir: str,
+    generator_type: str,
+    config_path: str | None = None,
+    options: ReadOptions | None = None,
+    jobs: int = 1,
 ) -> dict[str, pd.DataFrame]:
     load_config_file(config_path)
-    dfs = load_dfs_per_suite_flat(requests_dir, generator_type)
+    if jobs > 1:
+        return load_dfs_per_suite_parallel(requests_dir, generator_type, options, jobs)
+    dfs = load_dfs_per_suite_flat(requests_dir, generator_type, options)
     return dfs
 
 
@@ -17,127 +178,1165 @@ def load_config_file(config_path: str | None) -> dict[str, Any] | None:
     return load_config(config_path)
 
 
+def load_streaming(
+    requests_dir: str,
+    generator_type: str,
+    config_path: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> "LazyResults":
+    """Like `load_lazy`, but results files are returned as chunk iterators."""
+    load_config_file(config_path)
+    return LazyResults(requests_dir, generator_type, options, chunk_size)
+
+
+def load_lazy(
+    requests_dir: str,
+    generator_type: str,
+    config_path: str | None = None,
+    options: ReadOptions | None = None,
+) -> "LazyResults":
+    """Like `load`, but each test is parsed only when it is looked up."""
+    load_config_file(config_path)
+    return LazyResults(requests_dir, generator_type, options)
+
+
+class LazyResults(Mapping[str, Any]):
+    """Read-only `{suite.test: DataFrame}` mapping that parses on every access."""
+
+    def __init__(
+        self,
+        requests_dir: str,
+        generator_type: str,
+        options: ReadOptions | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        self.generator_type = generator_type
+        self.options = options or ReadOptions()
+        self.chunk_size = chunk_size
+        # key -> test entry, or the resource file path for `_resources` keys
+        self._entries: dict[str, TestEntry | str] = {}
+        for entry in discover_tests(requests_dir, generator_type, self.options):
+            self._entries[entry.key] = entry
+            if entry.resource_path is not None:
+                self._entries[f"{entry.key}_resources"] = entry.resource_path
+
+    def __getitem__(self, key: str) -> Any:
+        entry = self._entries[key]
+        if isinstance(entry, str):
+            return read_resource_file(entry, self.options)
+        if self.chunk_size:
+            return iter_test_chunks(
+                entry, self.generator_type, self.chunk_size, self.options
+            )
+        return read_test_results(entry, self.generator_type, self.options)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class TestEntry:
+    """One discovered test: its results file(s), one per shard, and optional resource file."""
+
+    suite: str
+    testname: str
+    results_paths: tuple[str, ...]
+    resource_path: str | None
+    shard_names: tuple[str, ...] = ()
+    clock_offsets_ms: tuple[int, ...] = ()
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}.{self.testname}"
+
+
+def discover_tests(
+    requests_dir: str, generator_type: str, options: ReadOptions | None = None
+) -> list[TestEntry]:
+    """Build the manifest of tests under `requests_dir` in report order."""
+    options = options or ReadOptions()
+    offsets = (get_config_value("shards", {}) or {}).get("clock_offsets_ms", {}) or {}
+    entries = _scan_test_dir(requests_dir, "__root__", generator_type, offsets)
+    with os.scandir(requests_dir) as listing:
+        suites = sorted(
+            (entry.name, entry.path)
+            for entry in listing
+            if entry.name != CACHE_DIR_NAME and entry.is_dir()
+        )
+    for suite_name, suite_path in suites:
+        entries.extend(_scan_test_dir(suite_path, suite_name, generator_type, offsets))
+    return [entry for entry in entries if is_test_selected(entry.key, options)]
+
+
+def _scan_test_dir(
+    directory: str, suite: str, generator_type: str, offsets: dict[str, int]
+) -> list[TestEntry]:
+    with os.scandir(directory) as listing:
+        files = sorted(entry.name for entry in listing if entry.is_file())
+    present = set(files)
+    # sorted order puts `x.csv` before `x.csv.gz`, so a plain file wins
+    results: dict[str, str] = {}
+    for filename in files:
+        testname = result_testname(filename, generator_type)
+        if (
+            testname is not None
+            and testname not in results
+            and is_recognised_results(path.join(directory, filename), generator_type)
+        ):
+            results[testname] = filename
+
+    # test name -> [(shard name, filename)], in first-seen order
+    grouped: dict[str, list[tuple[str, str]]] = {}
+    for testname, filename in results.items():
+        match = SHARD_PATTERN.match(testname)
+        # a plain `<test>.csv` next to shard files keeps them as separate tests
+        if match is not None and match.group("test") not in results:
+            grouped.setdefault(match.group("test"), []).append(
+                (match.group("shard"), filename)
+            )
+        else:
+            grouped.setdefault(testname, []).append(("", filename))
+
+    entries: list[TestEntry] = []
+    for testname, shards in grouped.items():
+        resource_path = None
+        for suffix in ("",) + COMPRESSION_SUFFIXES:
+            resource_name = f"{testname}{RESOURCE_SUFFIX}{suffix}"
+            if resource_name in present:
+                resource_path = path.join(directory, resource_name)
+                break
+        shard_names = tuple(name for name, _ in shards if name)
+        entries.append(
+            TestEntry(
+                suite,
+                testname,
+                tuple(path.join(directory, filename) for _, filename in shards),
+                resource_path,
+                shard_names,
+                tuple(int(offsets.get(name, 0)) for name in shard_names),
+            )
+        )
+    return entries
+
+
+def is_test_selected(key: str, options: ReadOptions) -> bool:
+    """Apply the include/exclude globs to a `suite.test` key."""
+    if options.include and not any(fnmatchcase(key, pattern) for pattern in options.include):
+        return False
+    return not any(fnmatchcase(key, pattern) for pattern in options.exclude)
+
+
+def result_testname(filename: str, generator_type: str) -> str | None:
+    """Return the test name for a results file, or None if it is not one."""
+    filename = strip_compression_suffix(filename)
+    if filename.endswith(RESOURCE_SUFFIX):
+        return None
+    generator = get_generator(generator_type)
+    for extension in generator.extensions:
+        if filename.endswith(extension):
+            return filename[: -len(extension)]
+    if generator.name_pattern is not None:
+        match = generator.name_pattern.fullmatch(filename)
+        if match is not None:
+            return match.group("test")
+    return None
+
+
+def is_recognised_results(file_path: str, generator_type: str) -> bool:
+    """Check the content of files whose extension alone says too little."""
+    generator = get_generator(generator_type)
+    if generator.sniff is None or not strip_compression_suffix(file_path).endswith(
+        generator.sniffed_extensions
+    ):
+        return True
+    try:
+        return generator.sniff(file_path)
+    except (OSError, EOFError, UnicodeDecodeError):
+        return False
+
+
+def strip_compression_suffix(filename: str) -> str:
+    for suffix in COMPRESSION_SUFFIXES:
+        if filename.endswith(suffix):
+            return filename[: -len(suffix)]
+    return filename
+
+
+def open_text(file_path: str) -> IO[str]:
+    """Open a possibly compressed file for streaming text reads."""
+    opener = COMPRESSION_OPENERS.get(path.splitext(file_path)[1], open)
+    return opener(file_path, "rt", encoding="UTF-8")
+
+
+def open_binary(file_path: str) -> IO[bytes]:
+    """Open a possibly compressed file for streaming binary reads."""
+    opener = COMPRESSION_OPENERS.get(path.splitext(file_path)[1], open)
+    return opener(file_path, "rb")
+
+
+def is_xml_results(file_path: str) -> bool:
+    """Sniff whether a JMeter results file is an XML JTL rather than CSV."""
+    with open_binary(file_path) as f:
+        head = f.read(256).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"<")
+
+
+def is_jmeter_xml(file_path: str) -> bool:
+    """Sniff whether an `.xml` file is a JMeter XML JTL."""
+    with open_binary(file_path) as f:
+        return b"<testResults" in f.read(SNIFF_SIZE)
+
+
+def is_k6_json(file_path: str) -> bool:
+    """Sniff whether a `.json` file is k6 `--out json` output."""
+    with open_text(file_path) as f:
+        line = f.readline(SNIFF_SIZE)
+    return line.lstrip().startswith("{") and _K6_JSON_TYPE.search(line) is not None
+
+
+def read_test_results(
+    entry: TestEntry, generator_type: str, options: ReadOptions | None = None
+) -> pd.DataFrame:
+    """Read the results of one discovered test, merging shards if it has any."""
+    options = options or ReadOptions()
+    if not entry.shard_names:
+        return read_results_file(entry.results_paths[0], generator_type, options)
+    chunks = list(iter_test_chunks(entry, generator_type, DEFAULT_CHUNK_SIZE, options))
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=RESULT_COLUMNS)
+    return compact_results_frame(df) if options.compact else df
+
+
+def iter_test_chunks(
+    entry: TestEntry,
+    generator_type: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream the results of one test; shards are merged by timeStamp (see merge_shard_chunks)."""
+    options = options or ReadOptions()
+    if not entry.shard_names:
+        yield from iter_result_chunks(
+            entry.results_paths[0], generator_type, chunk_size, options
+        )
+        return
+    streams = [
+        _iter_shard_chunks(file_path, generator_type, chunk_size, options)
+        for file_path in entry.results_paths
+    ]
+    for chunk in merge_shard_chunks(streams, entry.clock_offsets_ms, chunk_size):
+        yield compact_results_frame(chunk) if options.compact else chunk
+
+
+def _iter_shard_chunks(
+    file_path: str, generator_type: str, chunk_size: int, options: ReadOptions
+) -> Iterator[pd.DataFrame]:
+    df = load_cached_results(file_path, generator_type, options) if options.cache else None
+    if df is None:
+        yield from iter_result_chunks(file_path, generator_type, chunk_size, options)
+        return
+    # a cached shard is memory-mapped, so slicing it reads pages on demand
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def merge_shard_chunks(
+    streams: list[Iterator[pd.DataFrame]],
+    offsets_ms: Sequence[int] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """Merge per-shard chunk streams into chunks of about `chunk_size` rows sorted by `timeStamp`."""
+    offsets = list(offsets_ms) + [0] * (len(streams) - len(offsets_ms))
+    buffers: list[pd.DataFrame | None] = [None] * len(streams)
+    exhausted = [False] * len(streams)
+    # newest completion (timeStamp + elapsed) read from each shard
+    completed: list[Any] = [None] * len(streams)
+    longest = 0
+    pending: list[pd.DataFrame] = []
+    pending_rows = 0
+    while True:
+        for index, stream in enumerate(streams):
+            # shards are written in completion order, so a row not read yet
+            # started at most `longest` before the shard's newest completion
+            while not exhausted[index] and _shard_needs_chunk(
+                buffers[index], completed[index], longest
+            ):
+                chunk = next(stream, None)
+                if chunk is None:
+                    exhausted[index] = True
+                    break
+                if offsets[index]:
+                    chunk = chunk.assign(timeStamp=chunk["timeStamp"] + offsets[index])
+                if len(chunk):
+                    elapsed = chunk["elapsed"].max()
+                    if pd.notna(elapsed):
+                        longest = max(longest, elapsed)
+                    end = (chunk["timeStamp"] + chunk["elapsed"].fillna(0)).max()
+                    if completed[index] is None or end > completed[index]:
+                        completed[index] = end
+                buf = buffers[index]
+                buffers[index] = (
+                    chunk
+                    if buf is None or buf.empty
+                    else pd.concat([buf, chunk], ignore_index=True)
+                )
+        live = [index for index, buf in enumerate(buffers) if buf is not None and not buf.empty]
+        if not live:
+            break
+        settled = [completed[i] - longest for i in live if not exhausted[i]]
+        watermark = min(settled) if settled else None
+        parts: list[pd.DataFrame] = []
+        for index in live:
+            buf = buffers[index]
+            if watermark is None:
+                parts.append(buf)
+                buffers[index] = None
+                continue
+            ready = buf["timeStamp"].to_numpy() <= watermark
+            parts.append(buf[ready])
+            buffers[index] = buf[~ready]
+        merged = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+        if merged.empty:
+            continue
+        # every piece lies at or above the previous watermark, so sorted
+        # pieces concatenate in order
+        pending.append(merged.sort_values("timeStamp", kind="stable", ignore_index=True))
+        pending_rows += len(merged)
+        if pending_rows >= chunk_size:
+            yield pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+            pending, pending_rows = [], 0
+    if pending:
+        yield pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+
+
+def _shard_needs_chunk(buffer: pd.DataFrame | None, completed: Any, longest: Any) -> bool:
+    # empty, or none of the buffered rows is settled yet
+    if buffer is None or buffer.empty:
+        return True
+    return buffer["timeStamp"].min() > completed - longest
+
+
+def iter_result_chunks(
+    file_path: str,
+    generator_type: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Read any supported results file in normalized chunks."""
+    yield from get_generator(generator_type).iter_chunks(
+        file_path, chunk_size, options or ReadOptions()
+    )
+
+
+def iter_csv_chunks(
+    file_path: str,
+    generator_type: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Read a results CSV in fixed-size, normalized chunks."""
+    options = options or ReadOptions()
+    kwargs = csv_read_kwargs(generator_type, options)
+    if kwargs.get("engine") == "pyarrow":
+        # pyarrow cannot read in chunks; the C parser handles every other option
+        kwargs["engine"] = "c"
+    timestamps = TimestampParser()
+    with pd.read_csv(file_path, chunksize=chunk_size, **kwargs) as reader:
+        for chunk in reader:
+            yield normalize_results(chunk, generator_type, options, timestamps)
+
+
+def read_results_file(
+    file_path: str, generator_type: str, options: ReadOptions | None = None
+) -> pd.DataFrame:
+    """Read a whole results file of any supported generator."""
+    options = options or ReadOptions()
+    if options.cache:
+        cached = load_cached_results(file_path, generator_type, options)
+        if cached is not None:
+            return cached
+    df = next(get_generator(generator_type).iter_chunks(file_path, None, options))
+    if options.cache:
+        store_cached_frame(file_path, _cache_variant(generator_type, options), df)
+    return df
+
+
+def load_cached_results(
+    file_path: str, generator_type: str, options: ReadOptions
+) -> pd.DataFrame | None:
+    """Return the valid sidecar cache of a results file, or None."""
+    return load_cached_frame(file_path, _cache_variant(generator_type, options))
+
+
+def _cache_variant(generator_type: str, options: ReadOptions) -> dict[str, Any]:
+    return {
+        "generator": generator_type,
+        "compact": options.compact,
+        "normalization": NORMALIZATION_VERSION,
+    }
+
+
+def read_results_csv(
+    file_path: str, generator_type: str, options: ReadOptions | None = None
+) -> pd.DataFrame:
+    """Read a whole results CSV and normalize it to the analyzer columns."""
+    options = options or ReadOptions()
+    df = pd.read_csv(file_path, **csv_read_kwargs(generator_type, options))
+    return normalize_results(df, generator_type, options)
+
+
+def read_k6_csv(file_path: str, options: ReadOptions | None = None) -> pd.DataFrame:
+    """Read a k6 CSV keeping only `http_req_duration` rows."""
+    options = options or ReadOptions()
+    chunks = iter_csv_chunks(file_path, "k6", FILTERED_READ_CHUNK_SIZE, options)
+    return concat_result_chunks(chunks, options.compact)
+
+
+def concat_result_chunks(chunks: Iterator[pd.DataFrame], compact: bool) -> pd.DataFrame:
+    """Concatenate filtered results chunks into one frame."""
+    kept = list(chunks)
+    if not kept:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    df = pd.concat(kept, ignore_index=True)
+    if compact:
+        # chunks carry their own categories, which concat falls back to object for
+        df = compact_results_frame(df)
+    return df
+
+
+def iter_jtl_xml_chunks(
+    file_path: str, chunk_size: int | None = DEFAULT_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Stream a JMeter XML JTL into normalized frames of `chunk_size` rows."""
+    labels: dict[str, int] = {}
+    codes: dict[str, int] = {}
+    timestamps = array("q")
+    elapsed = array("i")
+    success = array("b")
+    label_codes = array("i")
+    response_codes = array("i")
+    emitted = False
+    depth = 0
+    root = None
+    with open_binary(file_path) as f:
+        for event, elem in ElementTree.iterparse(f, events=("start", "end")):
+            if elem.tag not in JTL_SAMPLE_TAGS:
+                if event == "start" and root is None:
+                    root = elem
+                continue
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            attrib = elem.attrib
+            timestamps.append(int(attrib.get("ts", 0)))
+            elapsed.append(int(attrib.get("t", 0)))
+            success.append(attrib.get("s", "true") == "true")
+            label_codes.append(_intern(labels, attrib.get("lb", "")))
+            response_codes.append(_intern(codes, attrib.get("rc", "")))
+            elem.clear()
+            if depth == 0 and root is not None:
+                root.clear()
+            if chunk_size and len(timestamps) >= chunk_size:
+                yield _jtl_frame(
+                    timestamps, elapsed, success, label_codes, response_codes, labels, codes
+                )
+                emitted = True
+                timestamps, elapsed, success = array("q"), array("i"), array("b")
+                label_codes, response_codes = array("i"), array("i")
+    if timestamps or not emitted:
+        yield _jtl_frame(
+            timestamps, elapsed, success, label_codes, response_codes, labels, codes
+        )
+
+
+def _jtl_frame(
+    timestamps: array,
+    elapsed: array,
+    success: array,
+    label_codes: array,
+    response_codes: array,
+    labels: dict[str, int],
+    codes: dict[str, int],
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "label": pd.Categorical.from_codes(
+                np.frombuffer(label_codes, dtype=np.int32), categories=list(labels)
+            ),
+            "timeStamp": np.frombuffer(timestamps, dtype=np.int64).copy(),
+            "elapsed": np.frombuffer(elapsed, dtype=np.int32).copy(),
+            "success": np.frombuffer(success, dtype=np.int8).astype(bool),
+            "responseCode": pd.Categorical.from_codes(
+                np.frombuffer(response_codes, dtype=np.int32), categories=list(codes)
+            ),
+        }
+    )
+
+
+def iter_k6_json_chunks(
+    file_path: str, chunk_size: int | None = DEFAULT_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Stream a k6 NDJSON file into normalized frames of `chunk_size` rows."""
+    labels: dict[tuple[str, str], int] = {}
+    times: list[str] = []
+    values = array("d")
+    statuses = array("i")
+    label_codes = array("i")
+    emitted = False
+    with open_text(file_path) as f:
+        for line in f:
+            if (
+                "http_req_duration" not in line
+                or _K6_JSON_POINT.search(line) is None
+                or _K6_JSON_DURATION.search(line) is None
+            ):
+                continue
+            time_match = _K6_JSON_FIELDS["time"].search(line)
+            value_match = _K6_JSON_VALUE.search(line)
+            if time_match is None or value_match is None:
+                continue
+            key = (_k6_json_field(line, "method"), _k6_json_field(line, "url"))
+            code = labels.get(key)
+            if code is None:
+                code = labels[key] = len(labels)
+            status = _k6_json_field(line, "status")
+            times.append(time_match.group(1))
+            values.append(float(value_match.group(1)))
+            statuses.append(int(status) if status.isdigit() else 0)
+            label_codes.append(code)
+            if chunk_size and len(values) >= chunk_size:
+                yield _k6_json_frame(times, values, statuses, label_codes, labels)
+                emitted = True
+                times, values = [], array("d")
+                statuses, label_codes = array("i"), array("i")
+    if values or not emitted:
+        yield _k6_json_frame(times, values, statuses, label_codes, labels)
+
+
+def _k6_json_field(line: str, name: str) -> str:
+    match = _K6_JSON_FIELDS[name].search(line)
+    if match is None:
+        return ""
+    text = match.group(1)
+    # k6 escapes &, < and > as \u00XX, so only then pay for a real decode
+    return json.loads(f'"{text}"') if "\\" in text else text
+
+
+def _k6_json_frame(
+    times: list[str],
+    values: array,
+    statuses: array,
+    label_codes: array,
+    labels: dict[tuple[str, str], int],
+) -> pd.DataFrame:
+    timestamps = pd.to_datetime(pd.Series(times, dtype=object), format="ISO8601", utc=True)
+    epoch = pd.Timestamp(0, tz="UTC")
+    status = np.frombuffer(statuses, dtype=np.int32).astype("int64")
+    return pd.DataFrame(
+        {
+            "label": pd.Categorical.from_codes(
+                np.frombuffer(label_codes, dtype=np.int32),
+                categories=[f"{method} {url}" for method, url in labels],
+            ),
+            "timeStamp": ((timestamps - epoch) // pd.Timedelta(1, "ms")).to_numpy("int64"),
+            "elapsed": np.frombuffer(values, dtype=np.float64).copy(),
+            "success": status < 400,
+            "responseCode": status,
+        }
+    )
+
+
+def iter_gatling_chunks(
+    file_path: str,
+    chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream the REQUEST records of a Gatling (up to 3.9) text `simulation.log`."""
+    options = options or ReadOptions()
+    if chunk_size is None:
+        yield concat_result_chunks(
+            iter_gatling_chunks(file_path, FILTERED_READ_CHUNK_SIZE, options), True
+        )
+        return
+    with pd.read_csv(
+        file_path,
+        sep="\t",
+        header=None,
+        names=GATLING_COLUMNS,
+        dtype=str,
+        keep_default_na=False,
+        quoting=csv.QUOTE_NONE,
+        on_bad_lines="skip",
+        chunksize=chunk_size,
+    ) as reader:
+        for chunk in reader:
+            requests = chunk[chunk["record"] == "REQUEST"]
+            if len(requests):
+                df = _gatling_frame(requests)
+                yield compact_results_frame(df) if options.compact else df
+
+
+def _gatling_frame(requests: pd.DataFrame) -> pd.DataFrame:
+    start = requests["start"].astype("int64").to_numpy()
+    end = requests["end"].astype("int64").to_numpy()
+    status = requests["status"]
+    # Gatling logs no response codes: failed checks name theirs in the message
+    # ("but actually found 500"), anything else gets its OK/KO status
+    code = requests["message"].str.extract(_GATLING_FOUND_CODE, expand=False)
+    # requests inside groups are reported as "group / name"
+    group = requests["group"].fillna("")
+    label = requests["name"].where(group == "", group + " / " + requests["name"])
+    return pd.DataFrame(
+        {
+            "label": pd.Categorical(label),
+            "timeStamp": start,
+            "elapsed": (end - start).astype("int32"),
+            "success": (status == "OK").to_numpy(),
+            "responseCode": pd.Categorical(code.fillna(status)),
+        }
+    )
+
+
+def iter_locust_chunks(
+    file_path: str,
+    chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    options: ReadOptions | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Expand a Locust `*_stats_history.csv` into one row per request."""
+    options = options or ReadOptions()
+    if chunk_size is None:
+        yield concat_result_chunks(
+            iter_locust_chunks(file_path, FILTERED_READ_CHUNK_SIZE, options), options.compact
+        )
+        return
+    labels: dict[str, int] = {}
+    # last cumulative total, failures and mean of every label code so far
+    last = np.zeros((0, 3))
+    with pd.read_csv(file_path, usecols=LOCUST_COLUMNS, chunksize=chunk_size) as reader:
+        for history in reader:
+            # rows are cumulative per endpoint: the difference to the previous
+            # row gives that interval's requests, emitted at the row's timestamp
+            # with the interval mean as elapsed; "Aggregated" sums the endpoints
+            history = history[history["Name"] != "Aggregated"]
+            label = (
+                history["Type"].fillna("").astype(str)
+                .str.cat(history["Name"].astype(str), sep=" ")
+                .str.strip()
+            )
+            chunk_codes, uniques = pd.factorize(label)
+            mapping = np.array(
+                [labels.setdefault(name, len(labels)) for name in uniques], dtype=np.int64
+            )
+            codes = mapping[chunk_codes]
+            if len(labels) > len(last):
+                last = np.vstack([last, np.zeros((len(labels) - len(last), 3))])
+            current = np.column_stack(
+                [
+                    pd.to_numeric(history[column], errors="coerce").fillna(0).to_numpy("float64")
+                    for column in LOCUST_COLUMNS[3:]
+                ]
+            )
+            # previous row of the same label, within the chunk or carried over
+            previous = pd.DataFrame(current).groupby(codes).shift().to_numpy()
+            first = np.isnan(previous[:, 0])
+            previous[first] = last[codes[first]]
+            if len(codes):
+                last[codes] = current  # later rows of a label overwrite earlier ones
+            total, failures, mean = current[:, 0].astype("int64"), current[:, 1].astype("int64"), current[:, 2]
+            prev_total = previous[:, 0].astype("int64")
+            # a total going backwards means the stats were reset
+            reset = total < prev_total
+            prev_total = np.where(reset, 0, prev_total)
+            prev_failures = np.where(reset, 0, previous[:, 1].astype("int64"))
+            prev_mean = np.where(reset, 0.0, previous[:, 2])
+
+            counts = total - prev_total
+            errors = np.clip(failures - prev_failures, 0, counts)
+            elapsed_sum = mean * total - prev_mean * prev_total
+            interval_mean = np.divide(
+                elapsed_sum, counts, out=np.zeros(len(counts)), where=counts > 0
+            )
+            kept = counts > 0
+            timestamps = pd.to_numeric(history["Timestamp"]).to_numpy("int64")[kept] * 1000
+            codes, counts = codes[kept], counts[kept]
+            errors, interval_mean = errors[kept], interval_mean[kept]
+            categories = pd.Index(list(labels))
+
+            # cut between intervals so chunks hold about chunk_size requests each
+            ends = np.cumsum(counts) // chunk_size
+            for piece in np.split(np.arange(len(counts)), np.flatnonzero(np.diff(ends)) + 1):
+                if not len(piece):
+                    continue
+                df = _locust_frame(
+                    timestamps[piece],
+                    codes[piece],
+                    categories,
+                    counts[piece],
+                    errors[piece],
+                    interval_mean[piece],
+                )
+                yield compact_results_frame(df) if options.compact else df
+
+
+def _locust_frame(
+    timestamps: np.ndarray,
+    label_codes: np.ndarray,
+    categories: pd.Index,
+    counts: np.ndarray,
+    errors: np.ndarray,
+    interval_mean: np.ndarray,
+) -> pd.DataFrame:
+    rows = np.repeat(np.arange(len(counts)), counts)
+    position = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    success = position >= errors[rows]
+    return pd.DataFrame(
+        {
+            "label": pd.Categorical.from_codes(label_codes[rows], categories=categories),
+            "timeStamp": timestamps[rows],
+            "elapsed": interval_mean[rows],
+            "success": success,
+            "responseCode": pd.Categorical.from_codes(
+                (~success).astype("int8"), categories=["OK", "KO"]
+            ),
+        }
+    )
+
+
+def normalize_results(
+    df: pd.DataFrame,
+    generator_type: str,
+    options: ReadOptions,
+    timestamps: "TimestampParser | None" = None,
+) -> pd.DataFrame:
+    """Normalize one parsed results CSV (or chunk of one)."""
+    normalize = get_generator(generator_type).normalize
+    if normalize is not None:
+        df = normalize(df)
+    elif "timeStamp" in df and not pd.api.types.is_integer_dtype(df["timeStamp"]):
+        parser = timestamps or TimestampParser()
+        df = df.assign(timeStamp=parser.to_epoch_ms(df["timeStamp"]))
+    if options.compact:
+        df = compact_results_frame(df)
+    return df
+
+
+def csv_read_kwargs(
+    generator_type: str, options: ReadOptions | None = None
+) -> dict[str, Any]:
+    """Return the `pd.read_csv` keyword arguments for the given options."""
+    options = options or ReadOptions()
+    kwargs: dict[str, Any] = {}
+    engine = resolve_csv_engine(options.engine)
+    if engine is not None:
+        kwargs["engine"] = engine
+    generator = get_generator(generator_type)
+    if generator.csv_columns is not None:
+        # the format's normalize discards every other column anyway
+        kwargs["usecols"] = list(generator.csv_columns)
+        if generator.csv_dtypes is not None:
+            kwargs["dtype"] = dict(generator.csv_dtypes)
+    elif options.compact:
+        kwargs["usecols"] = RESULT_COLUMNS
+        # timeStamp may be a formatted date; normalize_results converts it
+        kwargs["dtype"] = {k: v for k, v in RESULT_DTYPES.items() if k != "timeStamp"}
+    return kwargs
+
+
+class TimestampParser:
+    """Convert a results `timeStamp` column to int64 epoch milliseconds."""
+
+    def __init__(self) -> None:
+        self.format: str | None = None
+
+    def to_epoch_ms(self, values: pd.Series) -> np.ndarray:
+        if pd.api.types.is_integer_dtype(values):
+            return values.to_numpy("int64")
+        if pd.api.types.is_datetime64_any_dtype(values):
+            # pyarrow already parses ISO 8601 columns
+            parsed = values if values.dt.tz is not None else values.dt.tz_localize("UTC")
+        else:
+            values = values.astype(str)
+            if self.format is None:
+                self.format = detect_timestamp_format(values)
+            if self.format in (None, EPOCH_MS_FORMAT):
+                return pd.to_numeric(values).to_numpy("int64")
+            parsed = pd.to_datetime(values, format=self.format, utc=True, cache=True)
+        return ((parsed - _EPOCH) // pd.Timedelta(1, "ms")).to_numpy("int64")
+
+
+def detect_timestamp_format(values: pd.Series) -> str | None:
+    """Return the strftime format of a text `timeStamp` column."""
+    sample = values.dropna().head(TIMESTAMP_SAMPLE_SIZE)
+    if sample.empty:
+        return None
+    if sample.str.fullmatch(r"-?\d+").all():
+        return EPOCH_MS_FORMAT
+    for timestamp_format in TIMESTAMP_FORMATS:
+        try:
+            pd.to_datetime(sample, format=timestamp_format, utc=True)
+        except (ValueError, TypeError):
+            continue
+        return timestamp_format
+    guessed = guess_datetime_format(sample.iloc[0])
+    if guessed is None:
+        raise ValueError(f"Unrecognized timeStamp format: {sample.iloc[0]!r}")
+    return guessed
+
+
+def resolve_csv_engine(engine: str | None) -> str | None:
+    """Map "auto" to the fastest installed CSV engine."""
+    if engine != "auto":
+        return engine
+    if importlib.util.find_spec("pyarrow") is not None:
+        return "pyarrow"
+    return "c"
+
+
+def compact_results_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast normalized results columns to RESULT_DTYPES."""
+    dtypes = dict(RESULT_DTYPES)
+    if not pd.api.types.is_integer_dtype(df["elapsed"]):
+        dtypes["elapsed"] = "float64"
+    df = df[RESULT_COLUMNS]
+    if all(str(df[col].dtype) == dtype for col, dtype in dtypes.items()):
+        return df
+    return df.astype(dtypes)
+
+
 def load_dfs_per_suite_flat(
-    requests_dir: str, generator_type: str
+    requests_dir: str, generator_type: str, options: ReadOptions | None = None
 ) -> dict[str, pd.DataFrame]:
     results: dict[str, pd.DataFrame] = {}
 
-    for entry in sorted(listdir(requests_dir)):
-        full_path = path.join(requests_dir, entry)
-        if path.isfile(full_path) and entry.endswith(".csv"):
-            testname = entry[:-4]
-            key = f"__root__.{testname}"
-            df = pd.read_csv(full_path)
-            if generator_type == "k6":
-                df = normalize_k6(df)
-            results[key] = df
-            resource_df = load_resource_df_if_exists(requests_dir, testname)
-            if resource_df is not None:
-                results[f"{key}_resources"] = resource_df
-
-    for entry in sorted(listdir(requests_dir)):
-        suite_path = path.join(requests_dir, entry)
-        if not path.isdir(suite_path):
-            continue
-        suite_name = entry
-        for filename in sorted(listdir(suite_path)):
-            if not filename.endswith(".csv"):
-                continue
-            testname = filename[:-4]
-            file_path = path.join(suite_path, filename)
-            df = pd.read_csv(file_path)
-            if generator_type == "k6":
-                df = normalize_k6(df)
-            results[f"{suite_name}.{testname}"] = df
-            resource_df = load_resource_df_if_exists(suite_path, testname)
-            if resource_df is not None:
-                results[f"{suite_name}.{testname}_resources"] = resource_df
+    for entry in discover_tests(requests_dir, generator_type, options):
+        results[entry.key] = read_test_results(entry, generator_type, options)
+        if entry.resource_path is not None:
+            results[f"{entry.key}_resources"] = read_resource_file(
+                entry.resource_path, options
+            )
 
     return results
 
 
+def load_dfs_per_suite_parallel(
+    requests_dir: str,
+    generator_type: str,
+    options: ReadOptions | None = None,
+    jobs: int = 2,
+) -> dict[str, pd.DataFrame]:
+    """Parallel `load_dfs_per_suite_flat` over a pool of `jobs` processes."""
+    tests = discover_tests(requests_dir, generator_type, options)
+    results: dict[str, pd.DataFrame] = {}
+    if not tests:
+        return results
+    share_tracker_with_workers()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tests))) as pool:
+        handles = pool.map(
+            _load_test_shared,
+            tests,
+            [generator_type] * len(tests),
+            [options] * len(tests),
+        )
+        for entry, (df_handle, resource_handle) in zip(tests, handles):
+            results[entry.key] = import_frame(df_handle)
+            if resource_handle is not None:
+                results[f"{entry.key}_resources"] = import_frame(resource_handle)
+    return results
+
+
+def _load_test_shared(
+    entry: TestEntry, generator_type: str, options: ReadOptions | None
+) -> tuple[SharedFrame, SharedFrame | None]:
+    df = read_test_results(entry, generator_type, options)
+    resource_handle = None
+    if entry.resource_path is not None:
+        resource_handle = export_frame(read_resource_file(entry.resource_path, options))
+    return export_frame(df), resource_handle
+
+
 def load_dfs_grouped(
-    requests_dir: str, generator_type: str
+    requests_dir: str, generator_type: str, options: ReadOptions | None = None
 ) -> dict[str, Dict[str, pd.DataFrame]]:
     grouped: dict[str, Dict[str, pd.DataFrame]] = {}
-    root_suite: Dict[str, pd.DataFrame] = {}
-    for entry in listdir(requests_dir):
-        full_path = path.join(requests_dir, entry)
-        if path.isfile(full_path) and entry.endswith(".csv"):
-            testname = entry[:-4]
-            df = pd.read_csv(full_path)
-            if generator_type == "k6":
-                df = normalize_k6(df)
-            root_suite[testname] = df
-            resource_df = load_resource_df_if_exists(requests_dir, testname)
-            if resource_df is not None:
-                root_suite[f"{testname}_resources"] = resource_df
-    if root_suite:
-        grouped["__root__"] = root_suite
-
-    for entry in listdir(requests_dir):
-        suite_path = path.join(requests_dir, entry)
-        if not path.isdir(suite_path):
-            continue
-        suite_tests: Dict[str, pd.DataFrame] = {}
-        for filename in listdir(suite_path):
-            if not filename.endswith(".csv"):
-                continue
-            testname = filename[:-4]
-            file_path = path.join(suite_path, filename)
-            df = pd.read_csv(file_path)
-            if generator_type == "k6":
-                df = normalize_k6(df)
-            suite_tests[testname] = df
-            resource_df = load_resource_df_if_exists(suite_path, testname)
-            if resource_df is not None:
-                suite_tests[f"{testname}_resources"] = resource_df
-        if suite_tests:
-            grouped[entry] = suite_tests
+    for entry in discover_tests(requests_dir, generator_type, options):
+        suite_tests = grouped.setdefault(entry.suite, {})
+        suite_tests[entry.testname] = read_test_results(entry, generator_type, options)
+        if entry.resource_path is not None:
+            suite_tests[f"{entry.testname}_resources"] = read_resource_file(
+                entry.resource_path, options
+            )
     return grouped
 
 
-def load_resource_df_if_exists(base_dir: str, testname: str) -> pd.DataFrame | None:
+def load_resource_df_if_exists(
+    base_dir: str, testname: str, options: ReadOptions | None = None
+) -> pd.DataFrame | None:
     """Return a flattened pod metrics dataframe if the resource file exists."""
-    resource_path = path.join(base_dir, f"{testname}_resources.json")
-    if not path.isfile(resource_path):
+    resource_path = find_resource_file(base_dir, testname)
+    if resource_path is None:
         return None
-    return load_resources_json(resource_path)
+    return read_resource_file(resource_path, options)
+
+
+def find_resource_file(base_dir: str, testname: str) -> str | None:
+    """Return the `_resources.json` of a test, preferring the uncompressed one."""
+    for suffix in ("",) + COMPRESSION_SUFFIXES:
+        resource_path = path.join(base_dir, f"{testname}{RESOURCE_SUFFIX}{suffix}")
+        if path.isfile(resource_path):
+            return resource_path
+    return None
+
+
+def read_resource_file(
+    resource_path: str, options: ReadOptions | None = None
+) -> pd.DataFrame:
+    """Parse a resource file, going through the sidecar cache if enabled."""
+    options = options or ReadOptions()
+    variant = {"generator": "resources", "normalization": NORMALIZATION_VERSION}
+    if options.cache:
+        cached = load_cached_frame(resource_path, variant)
+        if cached is not None:
+            return cached
+    df = load_resources_json(resource_path)
+    if options.cache:
+        store_cached_frame(resource_path, variant, df)
+    return df
 
 
 def load_resources_json(resource_path: str) -> pd.DataFrame:
-    with open(resource_path, "r", encoding="UTF-8") as f:
-        snapshots = json.load(f)
+    """Flatten a pod metrics snapshot file into one row per container sample."""
+    timestamps: list[Any] = []
+    timestamp_codes = array("i")
+    names: dict[str, dict[Any, int]] = {"podname": {}, "namespace": {}, "container": {}}
+    name_codes = {column: array("i") for column in names}
+    quantities: dict[str, dict[Any, int]] = {"cpu": {}, "memory": {}}
+    quantity_codes = {column: array("i") for column in quantities}
 
-    rows = []
-    for snapshot in snapshots or []:
-        timestamp = snapshot.get("timestamp")
+    for snapshot in iter_json_array(resource_path):
+        timestamp_code = len(timestamps)
+        timestamps.append(snapshot.get("timestamp"))
         for pod in snapshot.get("pods", []):
             metadata = pod.get("metadata", {})
-            podname = metadata.get("name")
-            namespace = metadata.get("namespace")
+            pod_code = _intern(names["podname"], metadata.get("name"))
+            namespace_code = _intern(names["namespace"], metadata.get("namespace"))
             for container in pod.get("containers", []):
                 usage = container.get("usage", {})
-                rows.append(
-                    {
-                        "timestamp": timestamp,
-                        "podname": podname,
-                        "namespace": namespace,
-                        "container": container.get("name"),
-                        "cpu": usage.get("cpu"),
-                        "memory": usage.get("memory"),
-                    }
+                timestamp_codes.append(timestamp_code)
+                name_codes["podname"].append(pod_code)
+                name_codes["namespace"].append(namespace_code)
+                name_codes["container"].append(
+                    _intern(names["container"], container.get("name"))
                 )
+                for column, lookup in quantities.items():
+                    quantity_codes[column].append(_intern(lookup, usage.get(column)))
+
+    timestamp_lookup = np.empty(len(timestamps), dtype=object)
+    timestamp_lookup[:] = timestamps
+    data: dict[str, Any] = {
+        "timestamp": timestamp_lookup[np.frombuffer(timestamp_codes, dtype=np.int32)]
+    }
+    for column, lookup in names.items():
+        codes = np.frombuffer(name_codes[column], dtype=np.int32)
+        categories = list(lookup)
+        if None in lookup:
+            # categories cannot hold None; missing names become NaN codes
+            none_code = lookup[None]
+            categories.remove(None)
+            remap = np.arange(len(lookup), dtype=np.int32)
+            remap[none_code] = -1
+            remap[none_code + 1 :] -= 1
+            codes = remap[codes]
+        data[column] = pd.Categorical.from_codes(codes, categories=categories)
+    for column, numeric_column, parse in (
+        ("cpu", "cpu_mcores", parse_cpu_quantities),
+        ("memory", "memory_bytes", parse_memory_quantities),
+    ):
+        values = parse(list(quantities[column]))
+        data[numeric_column] = values[np.frombuffer(quantity_codes[column], dtype=np.int32)]
+    return pd.DataFrame(data, columns=RESOURCE_COLUMNS)
 
-    columns = ["timestamp", "podname", "namespace", "container", "cpu", "memory"]
-    return pd.DataFrame(rows, columns=columns)
+
+def _intern(lookup: dict[Any, int], value: Any) -> int:
+    code = lookup.get(value)
+    if code is None:
+        code = lookup[value] = len(lookup)
+    return code
+
+
+def iter_json_array(
+    file_path: str, block_size: int = JSON_READ_BLOCK_SIZE
+) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time."""
+    decoder = json.JSONDecoder()
+    with open_text(file_path) as f:
+        buffer = f.read(block_size)
+        pos = _skip_json_whitespace(buffer, 0)
+        while pos == len(buffer) and (more := f.read(block_size)):
+            buffer += more
+            pos = _skip_json_whitespace(buffer, pos)
+        if buffer[pos : pos + 1] != "[":
+            document = buffer + f.read()
+            if json.loads(document) is not None:
+                raise json.JSONDecodeError("Expecting array", document, pos)
+            return
+        pos += 1
+        read_size = block_size
+        # what the array expects next: "first" element or "]", an "element"
+        # after a comma, or a "separator" after an element
+        expecting = "first"
+        while True:
+            pos = _skip_json_whitespace(buffer, pos)
+            if pos == len(buffer):
+                more = f.read(read_size)
+                if not more:
+                    raise json.JSONDecodeError("Unterminated array", buffer, pos)
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            char = buffer[pos]
+            if expecting == "separator":
+                if char == "]":
+                    _check_json_end(f, buffer, pos + 1, block_size)
+                    return
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                expecting = "element"
+                pos += 1
+                continue
+            if char == "]":
+                if expecting == "first":
+                    _check_json_end(f, buffer, pos + 1, block_size)
+                    return
+                raise json.JSONDecodeError("Expecting value", buffer, pos)
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                more = f.read(read_size)
+                if not more:
+                    raise
+                # element spans past the buffer; grow reads so huge elements stay linear
+                read_size *= 2
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            if _json_number_may_continue(element, buffer, end):
+                # "12" at the end of a block may be the start of "12.5e3"
+                more = f.read(read_size)
+                if more:
+                    read_size *= 2
+                    buffer, pos = buffer[pos:] + more, 0
+                    continue
+            read_size = block_size
+            yield element
+            expecting = "separator"
+            pos = end
+            if pos >= block_size:
+                buffer, pos = buffer[pos:], 0
+
+
+def _check_json_end(f: IO[str], buffer: str, pos: int, block_size: int) -> None:
+    while True:
+        pos = _skip_json_whitespace(buffer, pos)
+        if pos < len(buffer):
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+        buffer, pos = f.read(block_size), 0
+        if not buffer:
+            return
+
+
+def _json_number_may_continue(element: Any, buffer: str, end: int) -> bool:
+    if isinstance(element, bool) or not isinstance(element, (int, float)):
+        return False
+    return end == len(buffer) or not (buffer[end].isspace() or buffer[end] in ",]")
+
+
+def _skip_json_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos].isspace():
+        pos += 1
+    return pos
 
 
 def normalize_k6(df: pd.DataFrame) -> pd.DataFrame:
-    df = df[df["metric_name"] == "http_req_duration"].copy()
-    df["label"] = f"{df['method']} {df['url']}"
-    df["timeStamp"] = df["timestamp"] * 1000
-    df["elapsed"] = df["metric_value"]
-    df["responseCode"] = df["status"]
-    df["success"] = df["status"] < 400
-    return df[["label", "timeStamp", "elapsed", "success", "responseCode"]]
+    df = df[df["metric_name"] == "http_req_duration"]
+    status = df["status"]
+    if not status.isna().any():
+        status = status.astype("int64")
+    return pd.DataFrame(
+        {
+            "label": df["method"].astype(str).str.cat(df["url"].astype(str), sep=" "),
+            "timeStamp": df["timestamp"] * 1000,
+            "elapsed": df["metric_value"],
+            "success": status < 400,
+            "responseCode": status,
+        }
+    )
+
+
+def _iter_jmeter_results(
+    file_path: str, chunk_size: int | None, options: ReadOptions
+) -> Iterator[pd.DataFrame]:
+    # .jtl/.xml may hold CSV or XML results; is_xml_results tells them apart
+    if is_xml_results(file_path):
+        yield from iter_jtl_xml_chunks(file_path, chunk_size)
+    elif chunk_size is None:
+        yield read_results_csv(file_path, "jmeter", options)
+    else:
+        yield from iter_csv_chunks(file_path, "jmeter", chunk_size, options)
+
+
+def _iter_k6_results(
+    file_path: str, chunk_size: int | None, options: ReadOptions
+) -> Iterator[pd.DataFrame]:
+    if chunk_size is None:
+        yield read_k6_csv(file_path, options)
+    else:
+        yield from iter_csv_chunks(file_path, "k6", chunk_size, options)
+
+
+def _iter_k6_json_results(
+    file_path: str, chunk_size: int | None, options: ReadOptions
+) -> Iterator[pd.DataFrame]:
+    for chunk in iter_k6_json_chunks(file_path, chunk_size):
+        yield compact_results_frame(chunk) if options.compact else chunk
+
+
+register_generator(
+    GeneratorFormat(
+        "jmeter",
+        (".csv", ".jtl", ".xml"),
+        _iter_jmeter_results,
+        sniffed_extensions=(".xml",),
+        sniff=is_jmeter_xml,
+    )
+)
+register_generator(
+    GeneratorFormat(
+        "k6",
+        (".csv",),
+        _iter_k6_results,
+        csv_columns=tuple(K6_COLUMNS),
+        csv_dtypes=K6_DTYPES,
+        normalize=normalize_k6,
+    )
+)
+register_generator(
+    GeneratorFormat(
+        "k6-json",
+        (".json", ".ndjson"),
+        _iter_k6_json_results,
+        sniffed_extensions=(".json",),
+        sniff=is_k6_json,
+    )
+)
+register_generator(
+    GeneratorFormat(
+        "gatling",
+        (".simulation.log",),
+        iter_gatling_chunks,
+        # Gatling's own `simulation.log`, or renamed copies like `simulation-checkout.log`
+        name_pattern=re.compile(r"(?P<test>simulation.*)\.log"),
+    )
+)
+register_generator(GeneratorFormat("locust", ("_stats_history.csv",), iter_locust_chunks))
@@ -1,30 +1,78 @@
-from typing import Any
+from typing import Any, Mapping
 from .cli import parse_args
-from .loader import load
-from .analyzer import analyze_data
+from .cache import purge_cache
+from .loader import ReadOptions, load, load_lazy, load_streaming
+from .analyzer import analyze_data, analyze_parallel, analyze_source
 from .reporter import generate_excel_report
 from .graphs import create_and_save_graphs
-from .config_store import get_config_value, get_storage_config
-from .storage import append_verdicts
+from .config_store import get_config_value, get_storage_config, load_config
+from .rules import get_verdict_rules
+from .storage import HistogramHistory, append_verdicts, load_histogram_history
 
 
 def main():
 
     args = parse_args()
+    load_config(args.config)
+    # fail on a bad rule before any results are read
+    get_verdict_rules()
 
-    print("Loading results...")
-    dfs_raw = load(args.results_dir, args.generator, args.config)
+    if args.purge_cache:
+        removed = purge_cache(args.results_dir)
+        print(f"Purged {removed} results cache director{'y' if removed == 1 else 'ies'}.")
+    read_options = ReadOptions(
+        compact=args.compact,
+        engine=args.csv_engine,
+        cache=args.cache,
+        include=tuple(args.include),
+        exclude=tuple(args.exclude),
+    )
 
-    print("Analyzing results...")
-    analysis_results: list[dict[str, Any]] = [
-        analyze_data(test_name, df) for test_name, df in dfs_raw.items()
-    ]
+    analysis_results: list[Mapping[str, Any]]
+    if args.chunk_size:
+        print(f"Streaming results in chunks of {args.chunk_size} rows...")
+        sources = load_streaming(
+            args.results_dir, args.generator, args.config, args.chunk_size, read_options
+        )
+        analysis_results = [
+            analyze_source(test_name, sources[test_name]) for test_name in sources
+        ]
+    else:
+        analysis_jobs = args.analysis_jobs or args.jobs
+        if args.jobs > 1:
+            print("Loading results...")
+            dfs_raw = load(
+                args.results_dir, args.generator, args.config, read_options, args.jobs
+            )
+        else:
+            # parsed on lookup, so only the frames being analyzed are in memory
+            dfs_raw = load_lazy(
+                args.results_dir, args.generator, args.config, read_options
+            )
+
+        if analysis_jobs > 1:
+            print(f"Analyzing results in {analysis_jobs} processes...")
+            analysis_results = analyze_parallel(dfs_raw, analysis_jobs)
+        elif args.jobs > 1:
+            print("Analyzing results...")
+            analysis_results = [
+                analyze_data(test_name, df) for test_name, df in dfs_raw.items()
+            ]
+        else:
+            print("Loading and analyzing results one test at a time...")
+            # index inside the call so each frame is released as soon as its
+            # analysis returns
+            analysis_results = [
+                analyze_data(test_name, dfs_raw[test_name]) for test_name in dfs_raw
+            ]
 
     storage_config = get_storage_config()
     history: dict[str, dict[str, str]] | None = None
+    run_histograms: HistogramHistory | None = None
     if storage_config.get("enabled", True):
         print("Saving verdict history...")
         history = append_verdicts(analysis_results)
+        run_histograms = load_histogram_history()
     else:
         print("Verdict history storage is disabled by config, saving results skipped.")
 
@@ -39,7 +87,7 @@ def main():
         print("Dry run enabled, skipping report generation.")
         return
     print("Creating and saving excel report...")
-    generate_excel_report(analysis_results, args.output)
+    generate_excel_report(analysis_results, args.output, run_histograms)
 
 
 if __name__ == "__main__":
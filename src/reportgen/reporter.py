@@ -1,11 +1,22 @@
 from typing import Any, Dict, List
 import openpyxl as px
 import datetime as dt
+import math
 from openpyxl.utils import get_column_letter
+from .histogram import LatencyHistogram, merge_histograms
+from .rules import VerdictRule, format_metric_value
+from .storage import HistogramHistory, merged_run_histograms
+
+MAX_LISTED_OFFENDERS = 20
+# decimals of verdict rule values: at least 2, more while a value still
+# shows the same as the threshold it failed
+RULE_VALUE_DECIMALS = (2, 6)
 
 
 def generate_excel_report(
-    analysis_results: List[Dict[str, Any]], output_path: str
+    analysis_results: List[Dict[str, Any]],
+    output_path: str,
+    run_histograms: HistogramHistory | None = None,
 ) -> None:
     workbook, err = validate_results(analysis_results)
     if err:
@@ -21,6 +32,7 @@ def generate_excel_report(
         except (ValueError, KeyError):
             pass
 
+    # suite -> test -> {"result": ..., "resource": ...}; results are referenced, not copied
     suites: Dict[str, Dict[str, Dict[str, Any]]] = {}
     for result in analysis_results:
         test_name: str = str(result.get("test_name", "unknown.unknown"))
@@ -32,10 +44,11 @@ def generate_excel_report(
         suites.setdefault(suite, {}).setdefault(
             base_test, {"result": None, "resource": None}
         )
-        if is_resource_result(result):
-            suites[suite][base_test]["resource"] = {**result, "_suite": suite, "_test": base_test}
-        else:
-            suites[suite][base_test]["result"] = {**result, "_suite": suite, "_test": base_test}
+        kind = "resource" if is_resource_result(result) else "result"
+        suites[suite][base_test][kind] = result
+
+    percentile_names = collect_percentile_names(analysis_results)
+    percentile_headers = [f"{name.upper()} (ms)" for name in percentile_names]
 
     summary = workbook.create_sheet(title="Summary", index=0)
     summary.append(
@@ -44,6 +57,7 @@ def generate_excel_report(
             "Tests",
             "Error Rate",
             "Avg Resp (ms)",
+            *percentile_headers,
             "Verdict",
             "Avg CPU (mcores)",
             "Max CPU (mcores)",
@@ -52,6 +66,7 @@ def generate_excel_report(
         ]
     )
 
+    overall_histograms: List[LatencyHistogram] = []
     overall_tx = 0
     overall_err = 0
     overall_min = None
@@ -77,6 +92,7 @@ def generate_excel_report(
         suite_cpu_maxes: List[float] = []
         suite_mem_avgs: List[float] = []
         suite_mem_maxes: List[float] = []
+        suite_histograms: List[LatencyHistogram] = []
 
         for _, group in tests.items():
             r = group.get("result") or {}
@@ -99,6 +115,9 @@ def generate_excel_report(
             suite_weighted_sum_tx += tx
             if verdict.upper() == "FAIL":
                 suite_any_fail = True
+            histogram = r.get("response_time_histogram")
+            if histogram is not None:
+                suite_histograms.append(histogram)
 
             if res:
                 cpu_avg, cpu_max, mem_avg, mem_max = extract_resource_overall(res)
@@ -129,6 +148,7 @@ def generate_excel_report(
                 len(tests),
                 suite_err_rate,
                 round(suite_avg, 2),
+                *histogram_percentile_cells(suite_histograms, percentile_names),
                 suite_verdict,
                 suite_cpu_avg,
                 suite_cpu_max,
@@ -152,6 +172,7 @@ def generate_excel_report(
         weighted_sum_avg += suite_weighted_sum_avg
         weighted_sum_tx += suite_weighted_sum_tx
         overall_verdict_fail = overall_verdict_fail or suite_any_fail
+        overall_histograms.extend(suite_histograms)
         if suite_cpu_avg is not None:
             overall_cpu_avgs.append(suite_cpu_avg)
         if suite_cpu_max is not None:
@@ -172,6 +193,7 @@ def generate_excel_report(
             sum(len(v) for v in suites.values()),
             overall_err_rate,
             round(overall_avg, 2),
+            *histogram_percentile_cells(overall_histograms, percentile_names),
             "FAIL" if overall_verdict_fail else "PASS",
             sum(overall_cpu_avgs) / len(overall_cpu_avgs) if overall_cpu_avgs else None,
             max(overall_cpu_maxes) if overall_cpu_maxes else None,
@@ -196,6 +218,7 @@ def generate_excel_report(
                 "Avg Resp (ms)",
                 "Min Resp (ms)",
                 "Max Resp (ms)",
+                *percentile_headers,
                 "Verdict",
                 "Avg CPU (mcores)",
                 "Max CPU (mcores)",
@@ -214,8 +237,9 @@ def generate_excel_report(
         suite_cpu_maxes_local: List[float] = []
         suite_mem_avgs_local: List[float] = []
         suite_mem_maxes_local: List[float] = []
+        suite_histograms_local: List[LatencyHistogram] = []
 
-        for _, group in tests.items():
+        for test, group in tests.items():
             r = group.get("result") or {}
             res = group.get("resource") or {}
 
@@ -226,6 +250,9 @@ def generate_excel_report(
             rmin = r.get("overall_minimum_response_time")
             rmax = r.get("overall_maximum_response_time")
             verdict = str(r.get("verdict", ""))
+            percentiles = r.get("response_time_percentiles") or {}
+            if r.get("response_time_histogram") is not None:
+                suite_histograms_local.append(r["response_time_histogram"])
             cpu_avg, cpu_max, mem_avg, mem_max = extract_resource_overall(res)
 
             total_tx += tx
@@ -249,7 +276,7 @@ def generate_excel_report(
             error_rate = (err / tx) if tx > 0 else 0.0
             sheet.append(
                 [
-                    r.get("_test", "") or res.get("_test", ""),
+                    test,
                     tx,
                     err,
                     error_rate,
@@ -257,6 +284,7 @@ def generate_excel_report(
                     round(avg, 2),
                     rmin,
                     rmax,
+                    *(percentile_cell(percentiles.get(name)) for name in percentile_names),
                     verdict,
                     cpu_avg,
                     cpu_max,
@@ -292,6 +320,7 @@ def generate_excel_report(
                 round(suite_avg, 2),
                 min_of_min,
                 max_of_max,
+                *histogram_percentile_cells(suite_histograms_local, percentile_names),
                 "",
                 suite_cpu_avg_val,
                 suite_cpu_max_val,
@@ -302,50 +331,17 @@ def generate_excel_report(
         _rr2 = sheet.max_row
         sheet.cell(row=_rr2, column=4).number_format = "0.00%"
 
-        for col_idx, column_cells in enumerate(sheet.columns, start=1):
-            max_len = 0
-            for c in column_cells:
-                val = c.value
-                if val is None:
-                    disp = ""
-                elif (
-                    isinstance(val, (int, float))
-                    and isinstance(c.number_format, str)
-                    and "%" in c.number_format
-                ):
-                    try:
-                        disp = f"{float(val) * 100:.2f}%"
-                    except (ValueError, TypeError):
-                        disp = str(val)
-                else:
-                    disp = str(val)
-                if len(disp) > max_len:
-                    max_len = len(disp)
-            width = min(max(max_len + 2, 8), 60)
-            sheet.column_dimensions[get_column_letter(col_idx)].width = width
+        autosize_columns(sheet)
 
-    summary_sheet = workbook["Summary"]
-    for col_idx, column_cells in enumerate(summary_sheet.columns, start=1):
-        max_len = 0
-        for c in column_cells:
-            val = c.value
-            if val is None:
-                disp = ""
-            elif (
-                isinstance(val, (int, float))
-                and isinstance(c.number_format, str)
-                and "%" in c.number_format
-            ):
-                try:
-                    disp = f"{float(val) * 100:.2f}%"
-                except (ValueError, TypeError):
-                    disp = str(val)
-            else:
-                disp = str(val)
-            if len(disp) > max_len:
-                max_len = len(disp)
-        width = min(max(max_len + 2, 8), 60)
-        summary_sheet.column_dimensions[get_column_letter(col_idx)].width = width
+    if percentile_names:
+        append_api_latency_sheet(workbook, suites, percentile_names)
+    append_verdict_rules_sheet(workbook, suites)
+    append_response_codes_sheet(workbook, suites)
+    append_steady_state_sheet(workbook, suites)
+    if percentile_names and run_histograms:
+        append_run_history_sheet(workbook, suites, percentile_names, run_histograms)
+
+    autosize_columns(workbook["Summary"])
 
     workbook.save(
         f"{output_path}/report_{dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
@@ -389,3 +385,313 @@ def bytes_to_mib(value: Any) -> float | None:
         return float(value) / (1024**2)
     except (TypeError, ValueError):
         return None
+
+
+def collect_percentile_names(analysis_results: List[Dict[str, Any]]) -> List[str]:
+    names: List[str] = []
+    for result in analysis_results:
+        for name in result.get("response_time_percentiles") or {}:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def histogram_percentile_cells(
+    histograms: List[LatencyHistogram], percentile_names: List[str]
+) -> List[Any]:
+    """Percentiles of the merged test histograms, within their relative error."""
+    merged = merge_histograms(histograms)
+    if merged is None:
+        return [None for _ in percentile_names]
+    values = merged.percentiles([float(name[1:]) for name in percentile_names])
+    return [percentile_cell(value) for value in values]
+
+
+def percentile_cell(value: Any) -> Any:
+    if not isinstance(value, (int, float)) or math.isnan(value):
+        return None
+    return round(value, 2)
+
+
+def append_api_latency_sheet(
+    workbook: px.Workbook,
+    suites: Dict[str, Dict[str, Dict[str, Any]]],
+    percentile_names: List[str],
+) -> None:
+    sheet = workbook.create_sheet(title="API Latency")
+    sheet.append(
+        [
+            "Suite",
+            "Test",
+            "API",
+            "Transactions",
+            "Errors",
+            "Avg Resp (ms)",
+            "Min Resp (ms)",
+            "Max Resp (ms)",
+            *(f"{name.upper()} (ms)" for name in percentile_names),
+        ]
+    )
+    for suite_name, tests in suites.items():
+        for test_name, group in tests.items():
+            r = group.get("result") or {}
+            per_api = r.get("response_time_percentiles_per_api") or {}
+            for api, tx in (r.get("transaction_count_per_api") or {}).items():
+                avg = r.get("average_response_time_per_api", {}).get(api)
+                sheet.append(
+                    [
+                        suite_name,
+                        test_name,
+                        str(api),
+                        tx,
+                        r.get("error_count_per_api", {}).get(api),
+                        round(avg, 2) if isinstance(avg, (int, float)) else avg,
+                        r.get("minimum_response_time_per_api", {}).get(api),
+                        r.get("maximum_response_time_per_api", {}).get(api),
+                        *(
+                            percentile_cell(per_api.get(name, {}).get(api))
+                            for name in percentile_names
+                        ),
+                    ]
+                )
+    autosize_columns(sheet)
+
+
+def append_verdict_rules_sheet(
+    workbook: px.Workbook, suites: Dict[str, Dict[str, Dict[str, Any]]]
+) -> None:
+    """One row per test and verdict rule, listing what made a rule fail."""
+    rows = [
+        (suite_name, test_name, outcome)
+        for suite_name, tests in suites.items()
+        for test_name, group in tests.items()
+        for outcome in (group.get("result") or {}).get("verdict_rules") or []
+    ]
+    if not rows:
+        return
+    sheet = workbook.create_sheet(title="Verdict Rules")
+    sheet.append(
+        [
+            "Suite",
+            "Test",
+            "Rule",
+            "Metric",
+            "Scope",
+            "Threshold",
+            "Value",
+            "Result",
+            "Offenders",
+            "Offending Seconds/APIs",
+        ]
+    )
+    for suite_name, test_name, outcome in rows:
+        rule = outcome.rule
+        scope = rule.scope if rule.window is None else f"{rule.scope} ({rule.window}s window)"
+        offenders = list(outcome.offenders.items())
+        listed = ", ".join(
+            f"{key}: {format_metric_value(rule.metric, value, rule_value_decimals(rule, value))}"
+            for key, value in offenders[:MAX_LISTED_OFFENDERS]
+        )
+        if len(offenders) > MAX_LISTED_OFFENDERS:
+            listed += f", ... ({len(offenders) - MAX_LISTED_OFFENDERS} more)"
+        value = outcome.value
+        if value is not None and math.isnan(value):
+            value = None
+        sheet.append(
+            [
+                suite_name,
+                test_name,
+                rule.name,
+                rule.metric,
+                scope,
+                rule.describe_threshold(),
+                value,
+                outcome.status,
+                len(offenders),
+                listed if rule.scope != "overall" else None,
+            ]
+        )
+        if value is not None:
+            sheet.cell(row=sheet.max_row, column=7).number_format = rule_number_format(
+                rule.metric, rule_value_decimals(rule, value)
+            )
+    autosize_columns(sheet)
+
+
+def rule_value_decimals(rule: VerdictRule, value: float) -> int:
+    """Decimals that keep `value` from reading the same as a threshold it differs from."""
+    lowest, highest = RULE_VALUE_DECIMALS
+    bounds = [bound for bound in (rule.min, rule.max) if bound is not None and bound != value]
+    for decimals in range(lowest, highest):
+        shown = format_metric_value(rule.metric, value, decimals)
+        if all(shown != format_metric_value(rule.metric, bound, decimals) for bound in bounds):
+            return decimals
+    return highest
+
+
+def rule_number_format(metric: str, decimals: int) -> str:
+    """Excel number format matching rules.format_metric_value."""
+    digits = "0." + "0" * decimals if decimals else "0"
+    if metric == "error_rate":
+        return digits + "%"
+    if metric == "tps":
+        return digits
+    return f'{digits}" ms"'
+
+
+def append_response_codes_sheet(
+    workbook: px.Workbook, suites: Dict[str, Dict[str, Dict[str, Any]]]
+) -> None:
+    """Request counts per response code class and code, per test and API."""
+    results = [
+        (suite_name, test_name, group["result"])
+        for suite_name, tests in suites.items()
+        for test_name, group in tests.items()
+        if group.get("result") and group["result"].get("response_code_counts")
+    ]
+    if not results:
+        return
+    classes = sorted({c for _, _, r in results for c in r["response_code_class_counts"]})
+    codes = sorted({c for _, _, r in results for c in r["response_code_counts"]})
+    sheet = workbook.create_sheet(title="Response Codes")
+    sheet.append(["Suite", "Test", "API", "Transactions", "Errors", *classes, *codes])
+    for suite_name, test_name, r in results:
+        rows = [
+            (
+                "(all)",
+                r.get("overall_transaction_count"),
+                r.get("overall_error_count"),
+                r["response_code_class_counts"],
+                r["response_code_counts"],
+            )
+        ]
+        rows.extend(
+            (
+                str(api),
+                tx,
+                r.get("error_count_per_api", {}).get(api),
+                r.get("response_code_class_counts_per_api", {}).get(api, {}),
+                r.get("response_code_counts_per_api", {}).get(api, {}),
+            )
+            for api, tx in (r.get("transaction_count_per_api") or {}).items()
+        )
+        for api, tx, errors, class_counts, code_counts in rows:
+            sheet.append(
+                [
+                    suite_name,
+                    test_name,
+                    api,
+                    tx,
+                    errors,
+                    *(class_counts.get(c, 0) for c in classes),
+                    *(code_counts.get(c, 0) for c in codes),
+                ]
+            )
+    autosize_columns(sheet)
+
+
+def append_steady_state_sheet(
+    workbook: px.Workbook, suites: Dict[str, Dict[str, Dict[str, Any]]]
+) -> None:
+    """Boundaries of the steady-state window each test was analyzed on."""
+    rows = [
+        (suite_name, test_name, group["result"]["steady_state"])
+        for suite_name, tests in suites.items()
+        for test_name, group in tests.items()
+        if group.get("result") and group["result"].get("steady_state")
+    ]
+    if not rows:
+        return
+    sheet = workbook.create_sheet(title="Steady State")
+    sheet.append(
+        [
+            "Suite",
+            "Test",
+            "Plateau Found",
+            "Start (s)",
+            "End (s)",
+            "Trimmed Ramp-up (s)",
+            "Trimmed Ramp-down (s)",
+            "Trimmed Transactions",
+        ]
+    )
+    for suite_name, test_name, steady_state in rows:
+        sheet.append(
+            [
+                suite_name,
+                test_name,
+                "Yes" if steady_state["detected"] else "No",
+                steady_state["start_offset"],
+                steady_state["end_offset"],
+                steady_state["trimmed_start_seconds"],
+                steady_state["trimmed_end_seconds"],
+                steady_state["trimmed_transactions"],
+            ]
+        )
+    autosize_columns(sheet)
+
+
+def append_run_history_sheet(
+    workbook: px.Workbook,
+    suites: Dict[str, Dict[str, Dict[str, Any]]],
+    percentile_names: List[str],
+    run_histograms: HistogramHistory,
+) -> None:
+    """Percentiles over every stored run of each test, from the merged run histograms."""
+    sheet = workbook.create_sheet(title="Run History")
+    sheet.append(
+        [
+            "Suite",
+            "Test",
+            "API",
+            "Runs",
+            "Transactions",
+            *(f"{name.upper()} (ms)" for name in percentile_names),
+        ]
+    )
+    percentiles = [float(name[1:]) for name in percentile_names]
+    for suite_name, tests in suites.items():
+        for test_name, group in tests.items():
+            if not group.get("result"):
+                continue
+            runs, overall, per_api = merged_run_histograms(
+                run_histograms, str(group["result"].get("test_name"))
+            )
+            if overall is None:
+                continue
+            for api, histogram in [("ALL", overall), *per_api.items()]:
+                sheet.append(
+                    [
+                        suite_name,
+                        test_name,
+                        api,
+                        runs,
+                        histogram.total_count,
+                        *(percentile_cell(value) for value in histogram.percentiles(percentiles)),
+                    ]
+                )
+    autosize_columns(sheet)
+
+
+def autosize_columns(sheet: Any) -> None:
+    for col_idx, column_cells in enumerate(sheet.columns, start=1):
+        max_len = 0
+        for c in column_cells:
+            val = c.value
+            if val is None:
+                disp = ""
+            elif (
+                isinstance(val, (int, float))
+                and isinstance(c.number_format, str)
+                and "%" in c.number_format
+            ):
+                try:
+                    disp = f"{float(val) * 100:.2f}%"
+                except (ValueError, TypeError):
+                    disp = str(val)
+            else:
+                disp = str(val)
+            if len(disp) > max_len:
+                max_len = len(disp)
+        width = min(max(max_len + 2, 8), 60)
+        sheet.column_dimensions[get_column_letter(col_idx)].width = width
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
+
+import numpy as np
+
+from .histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from .rules import RuleOutcome
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SecondSeries(Mapping[int, Any]):
+    """One value per second of a test from `origin` on, backed by a NumPy array."""
+
+    array: np.ndarray
+    origin: int = 1
+
+    @property
+    def seconds(self) -> np.ndarray:
+        return np.arange(self.origin, self.origin + len(self.array))
+
+    def __getitem__(self, offset: int) -> Any:
+        if not isinstance(offset, (int, np.integer)):
+            raise KeyError(offset)
+        index = offset - self.origin
+        if not 0 <= index < len(self.array):
+            raise KeyError(offset)
+        return self.array[index].item()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.origin, self.origin + len(self.array)))
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __repr__(self) -> str:
+        return f"SecondSeries(origin={self.origin}, length={len(self.array)})"
+
+    def to_dict(self) -> dict[int, Any]:
+        return dict(zip(range(self.origin, self.origin + len(self.array)), self.array.tolist()))
+
+
+@dataclass(slots=True, eq=False)
+class TransactionResult(Mapping[str, Any]):
+    """Analysis of one test's results file, readable as the old result dict."""
+
+    test_name: str
+    transaction_count_per_api: dict[Any, int]
+    error_count_per_api: dict[Any, int]
+    overall_transaction_count: int
+    overall_error_count: int
+    test_duration_in_seconds: int
+    error_count_per_second: SecondSeries
+    transaction_count_per_second: SecondSeries
+    avg_response_time_per_second: SecondSeries
+    overall_maximum_response_time: Any
+    overall_minimum_response_time: Any
+    overall_avg_response_time: float
+    maximum_response_time_per_api: dict[Any, Any]
+    minimum_response_time_per_api: dict[Any, Any]
+    average_response_time_per_api: dict[Any, float]
+    response_time_percentiles: dict[str, float]
+    response_time_percentiles_per_api: dict[str, dict[Any, float]]
+    response_time_percentiles_per_second: dict[str, SecondSeries]
+    response_time_histogram: LatencyHistogram
+    response_time_histogram_per_api: dict[Any, LatencyHistogram]
+    # window length in seconds -> metric name -> series (percentiles nest by name)
+    rolling_windows: dict[int, dict[str, Any]] = field(default_factory=dict)
+    verdict: str = ""
+    # one outcome per configured verdict rule, see rules.evaluate_rules
+    verdict_rules: list[RuleOutcome] = field(default_factory=list)
+    # boundaries found by steady-state trimming (see analyzer.trim_to_steady_state);
+    # None when trimming is disabled
+    steady_state: dict[str, Any] | None = None
+    # response code and code class ("2xx", "5xx", "other") request counts;
+    # see analyzer.get_response_code_breakdown
+    response_code_counts: dict[str, int] = field(default_factory=dict)
+    response_code_counts_per_api: dict[Any, dict[str, int]] = field(default_factory=dict)
+    response_code_counts_per_second: dict[str, SecondSeries] = field(default_factory=dict)
+    response_code_class_counts: dict[str, int] = field(default_factory=dict)
+    response_code_class_counts_per_api: dict[Any, dict[str, int]] = field(default_factory=dict)
+    response_code_class_counts_per_second: dict[str, SecondSeries] = field(default_factory=dict)
+    # failed requests only, for the stacked error graph
+    error_count_per_second_by_class: dict[str, SecondSeries] = field(default_factory=dict)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _TRANSACTION_RESULT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TRANSACTION_RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(_TRANSACTION_RESULT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _TRANSACTION_RESULT_KEYS
+
+
+_TRANSACTION_RESULT_KEYS = {f.name: None for f in fields(TransactionResult)}
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from .config_store import get_config_value, get_rolling_windows
+
+SCOPES = ("overall", "per_second", "per_api")
+METRICS = ("error_rate", "tps", "avg_response_time")
+PERCENTILE_METRIC = re.compile(r"p\d+(\.\d+)?")
+RULE_KEYS = {"name", "metric", "scope", "window", "min", "max"}
+# metric -> key of the series in a result's "rolling_windows" entries
+WINDOW_SERIES = {
+    "error_rate": "error_rate",
+    "tps": "transactions_per_second",
+    "avg_response_time": "avg_response_time",
+}
+
+
+@dataclass(frozen=True)
+class VerdictRule:
+    """One threshold a test must meet to PASS."""
+
+    name: str
+    metric: str
+    scope: str = "overall"
+    window: int | None = None
+    min: float | None = None
+    max: float | None = None
+
+    def describe_threshold(self) -> str:
+        bounds = []
+        if self.min is not None:
+            bounds.append(f">= {format_metric_value(self.metric, self.min)}")
+        if self.max is not None:
+            bounds.append(f"<= {format_metric_value(self.metric, self.max)}")
+        return " and ".join(bounds)
+
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    """Result of one rule for one test."""
+
+    rule: VerdictRule
+    passed: bool
+    value: float | None
+    offenders: dict[Any, float] = field(default_factory=dict)
+    has_data: bool = True
+
+    @property
+    def status(self) -> str:
+        if not self.has_data:
+            return "NO DATA"
+        return "PASS" if self.passed else "FAIL"
+
+
+_compiled: tuple[Any, list[int], list[VerdictRule]] | None = None
+
+
+def get_verdict_rules() -> list[VerdictRule]:
+    """Rules of the loaded config, compiled once per config."""
+    global _compiled
+    evaluation_config = get_config_value("evaluation") or {}
+    windows = get_rolling_windows()
+    if _compiled is None or _compiled[0] is not evaluation_config or _compiled[1] != windows:
+        _compiled = (evaluation_config, windows, compile_rules(evaluation_config, windows))
+    return _compiled[2]
+
+
+def compile_rules(
+    evaluation_config: Mapping[str, Any], rolling_windows: Sequence[int] | None = None
+) -> list[VerdictRule]:
+    """Build the rules of an "evaluation" config section."""
+    rules: list[VerdictRule] = []
+    if evaluation_config.get("error_rate_threshold") is not None:
+        rules.append(
+            VerdictRule(
+                "error_rate", "error_rate", max=float(evaluation_config["error_rate_threshold"])
+            )
+        )
+    if evaluation_config.get("tps_threshold") is not None:
+        rules.append(
+            _validated(
+                VerdictRule(
+                    "tps",
+                    "tps",
+                    "per_second",
+                    window=evaluation_config.get("tps_window_seconds") or None,
+                    min=float(evaluation_config["tps_threshold"]),
+                )
+            )
+        )
+    if evaluation_config.get("response_time_avg_threshold") is not None:
+        rules.append(
+            VerdictRule(
+                "avg_response_time",
+                "avg_response_time",
+                max=float(evaluation_config["response_time_avg_threshold"]),
+            )
+        )
+    for spec in evaluation_config.get("rules") or []:
+        rules.append(rule_from_dict(spec))
+    for rule in rules:
+        if rule.window is not None and rolling_windows is not None and rule.window not in rolling_windows:
+            raise ValueError(
+                f"Verdict rule {rule.name!r}: window {rule.window} is not one of the "
+                f"configured rolling_windows_in_seconds {list(rolling_windows)}"
+            )
+    return rules
+
+
+def rule_from_dict(spec: Mapping[str, Any]) -> VerdictRule:
+    unknown = set(spec) - RULE_KEYS
+    if unknown:
+        raise ValueError(f"Unknown verdict rule keys {sorted(unknown)} in {dict(spec)}")
+    if "metric" not in spec:
+        raise ValueError(f"Verdict rule without a metric: {dict(spec)}")
+    scope = spec.get("scope", "overall")
+    window = spec.get("window")
+    rule = VerdictRule(
+        name=str(spec.get("name") or f"{spec['metric']} {scope}"),
+        metric=str(spec["metric"]),
+        scope=scope,
+        window=int(window) if window is not None else None,
+        min=float(spec["min"]) if spec.get("min") is not None else None,
+        max=float(spec["max"]) if spec.get("max") is not None else None,
+    )
+    return _validated(rule)
+
+
+def _validated(rule: VerdictRule) -> VerdictRule:
+    if rule.metric not in METRICS and not PERCENTILE_METRIC.fullmatch(rule.metric):
+        raise ValueError(
+            f"Verdict rule {rule.name!r}: metric must be one of {', '.join(METRICS)} "
+            f"or a percentile such as p99, got {rule.metric!r}"
+        )
+    if rule.scope not in SCOPES:
+        raise ValueError(
+            f"Verdict rule {rule.name!r}: scope must be one of {', '.join(SCOPES)}, "
+            f"got {rule.scope!r}"
+        )
+    if rule.min is None and rule.max is None:
+        raise ValueError(f"Verdict rule {rule.name!r} needs a min and/or max")
+    if rule.window is not None and (rule.scope != "per_second" or rule.window <= 0):
+        raise ValueError(
+            f"Verdict rule {rule.name!r}: window must be a positive number of "
+            "seconds on a per_second rule"
+        )
+    return rule
+
+
+def evaluate_rules(
+    result: Mapping[str, Any], rules: list[VerdictRule]
+) -> list[RuleOutcome]:
+    """Check every rule against the arrays of one transaction result."""
+    return [evaluate_rule(result, rule) for rule in rules]
+
+
+def evaluate_rule(result: Mapping[str, Any], rule: VerdictRule) -> RuleOutcome:
+    keys, values = rule_values(result, rule)
+    if not result["overall_transaction_count"] or np.isnan(values).all():
+        return RuleOutcome(rule=rule, passed=False, value=None, has_data=False)
+    failed = np.zeros(len(values), dtype=bool)
+    if rule.min is not None:
+        failed |= values < rule.min
+    if rule.max is not None:
+        failed |= values > rule.max
+    offending = np.flatnonzero(failed)
+
+    value = None
+    finite = values[~np.isnan(values)]
+    if rule.scope == "overall":
+        value = float(values[0]) if len(values) else None
+    elif len(finite):
+        value = float(finite.max() if rule.max is not None else finite.min())
+    return RuleOutcome(
+        rule=rule,
+        passed=not len(offending),
+        value=value,
+        offenders={keys[i]: float(values[i]) for i in offending.tolist()},
+    )
+
+
+def format_metric_value(metric: str, value: float, decimals: int = 2) -> str:
+    """`value` as reports show it: error rates in percent, TPS plain, latencies in ms."""
+    if metric == "error_rate":
+        return f"{value:.{decimals}%}"
+    if metric == "tps":
+        return f"{value:.{decimals}f}"
+    return f"{value:.{decimals}f} ms"
+
+
+def rule_values(result: Mapping[str, Any], rule: VerdictRule) -> tuple[Any, np.ndarray]:
+    """The values `rule` checks, with the second offsets or API labels they belong to."""
+    if rule.scope == "per_second":
+        return _per_second_values(result, rule)
+    if rule.scope == "per_api":
+        return _per_api_values(result, rule.metric)
+
+    count = result["overall_transaction_count"]
+    if rule.metric == "error_rate":
+        value = result["overall_error_count"] / count if count else 0.0
+    elif rule.metric == "tps":
+        duration = result["test_duration_in_seconds"]
+        value = count / duration if duration else 0.0
+    elif rule.metric == "avg_response_time":
+        value = result["overall_avg_response_time"]
+    else:
+        value = _percentile_source(result["response_time_percentiles"], rule.metric)
+    return ["overall"], np.array([value], dtype=np.float64)
+
+
+def _per_second_values(result: Mapping[str, Any], rule: VerdictRule) -> tuple[Any, np.ndarray]:
+    if rule.window is not None:
+        rolling = result.get("rolling_windows") or {}
+        if rule.window not in rolling:
+            raise ValueError(
+                f"Verdict rule {rule.name!r}: window {rule.window} is not one of the "
+                "configured rolling_windows_in_seconds"
+            )
+        metrics = rolling[rule.window]
+        if rule.metric in WINDOW_SERIES:
+            series = metrics[WINDOW_SERIES[rule.metric]]
+        else:
+            series = _percentile_source(metrics.get("response_time_percentiles", {}), rule.metric)
+        seconds, values = series.seconds, series.array
+        # judge full windows only, or the whole test when it is shorter
+        # than one window
+        first = rule.window - 1 if len(values) >= rule.window else max(len(values) - 1, 0)
+        return seconds[first:].tolist(), values[first:].astype(np.float64)
+
+    if rule.metric == "error_rate":
+        counts = result["transaction_count_per_second"]
+        errors = result["error_count_per_second"].array
+        values = np.divide(
+            errors, counts.array, out=np.zeros(len(errors)), where=counts.array > 0
+        )
+        return counts.seconds.tolist(), values
+    if rule.metric == "tps":
+        series = result["transaction_count_per_second"]
+    elif rule.metric == "avg_response_time":
+        series = result["avg_response_time_per_second"]
+    else:
+        series = _percentile_source(result["response_time_percentiles_per_second"], rule.metric)
+    return series.seconds.tolist(), series.array.astype(np.float64)
+
+
+def _per_api_values(result: Mapping[str, Any], metric: str) -> tuple[Any, np.ndarray]:
+    counts = result["transaction_count_per_api"]
+    labels = list(counts)
+    count_values = np.fromiter(counts.values(), dtype=np.float64, count=len(labels))
+    if metric == "error_rate":
+        errors = result["error_count_per_api"]
+        error_values = np.array([errors.get(label, 0) for label in labels], dtype=np.float64)
+        values = np.divide(
+            error_values, count_values, out=np.zeros(len(labels)), where=count_values > 0
+        )
+    elif metric == "tps":
+        duration = result["test_duration_in_seconds"]
+        values = count_values / duration if duration else np.zeros(len(labels))
+    else:
+        per_api = (
+            result["average_response_time_per_api"]
+            if metric == "avg_response_time"
+            else _percentile_source(result["response_time_percentiles_per_api"], metric)
+        )
+        values = np.array([per_api.get(label, np.nan) for label in labels], dtype=np.float64)
+    return labels, values
+
+
+def _percentile_source(by_name: Mapping[str, Any], metric: str) -> Any:
+    if metric not in by_name:
+        raise ValueError(
+            f"Percentile {metric!r} is not computed; add it to the \"percentiles\" config"
+        )
+    return by_name[metric]
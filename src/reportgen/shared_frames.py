@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """One DataFrame column in a shared memory block, so only category/unique values are pickled."""
+
+    name: str
+    kind: str  # "array", "category" or "factorized"
+    shm_name: str
+    dtype: str
+    length: int
+    uniques: list[Any] | None = None
+    original_dtype: str | None = None
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Picklable handle to a DataFrame whose buffers live in shared memory."""
+
+    columns: tuple[SharedColumn, ...]
+    length: int
+
+
+def share_tracker_with_workers() -> None:
+    """Start the resource tracker before a process pool is created, for workers to inherit."""
+    resource_tracker.ensure_running()
+
+
+def export_frame(df: pd.DataFrame) -> SharedFrame:
+    """Copy every column of `df` into shared memory; pass the handle to `import_frame`."""
+    columns: list[SharedColumn] = []
+    for name in df.columns:
+        kind, values, uniques = encode_column(df[name])
+        columns.append(
+            SharedColumn(
+                name=str(name),
+                kind=kind,
+                shm_name=_put_array(values),
+                dtype=values.dtype.str,
+                length=len(values),
+                uniques=uniques,
+                original_dtype=str(df[name].dtype),
+            )
+        )
+    return SharedFrame(columns=tuple(columns), length=len(df))
+
+
+def import_frame(frame: SharedFrame) -> pd.DataFrame:
+    """Rebuild the DataFrame behind `frame` and unlink its shared memory."""
+    data: dict[str, Any] = {}
+    for column in frame.columns:
+        values = _take_array(column.shm_name, column.dtype, column.length)
+        data[column.name] = decode_column(
+            column.kind, values, column.uniques, column.original_dtype
+        )
+    return pd.DataFrame(data, index=pd.RangeIndex(frame.length))
+
+
+def encode_column(series: pd.Series) -> tuple[str, np.ndarray, list[Any] | None]:
+    """Split a column into (kind, values, uniques): a flat numpy array plus the values it refers to."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category", series.cat.codes.to_numpy(), dtype.categories.tolist()
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        return "array", series.to_numpy(), None
+    codes, unique_values = pd.factorize(series, use_na_sentinel=True)
+    return "factorized", codes, pd.Index(unique_values).tolist()
+
+
+def decode_column(
+    kind: str,
+    values: np.ndarray,
+    uniques: list[Any] | None,
+    original_dtype: str | None = None,
+) -> Any:
+    """Inverse of `encode_column`."""
+    if kind == "category":
+        return pd.Categorical.from_codes(values, categories=uniques or [])
+    if kind == "factorized":
+        lookup = np.empty(len(uniques or []) + 1, dtype=object)
+        lookup[:-1] = uniques or []
+        lookup[-1] = np.nan
+        series = pd.Series(lookup[values], dtype=object)
+        if original_dtype not in (None, "object"):
+            series = series.astype(original_dtype)
+        return series
+    return values
+
+
+def _put_array(values: np.ndarray) -> str:
+    values = np.ascontiguousarray(values)
+    # zero-sized blocks are rejected by the OS
+    block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        target = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        target[...] = values
+        del target
+        return block.name
+    finally:
+        block.close()
+
+
+def _take_array(shm_name: str, dtype: str, length: int) -> np.ndarray:
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf)
+        values = view.copy()
+        del view
+        return values
+    finally:
+        block.close()
+        block.unlink()
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import math
 import pathlib
 from typing import Any
 
 from .config_store import get_storage_path
+from .histogram import LatencyHistogram, merge_histograms
 
 History = dict[str, dict[str, str]]
+# test name -> run timestamp -> {"overall": histogram, "apis": {api: histogram}}
+HistogramHistory = dict[str, dict[str, dict[str, Any]]]
 
 
 def load_history(path: pathlib.Path | None = None) -> History:
@@ -33,7 +37,7 @@ def save_history(history: History, path: pathlib.Path | None = None) -> None:
 
 
 def append_verdicts(analysis_results: list[dict[str, Any]], path: pathlib.Path | None = None) -> History:
-    """Append current run verdicts to history and return updated history."""
+    """Append current run verdicts and histograms to history and return updated history."""
     history = load_history(path)
     timestamp = dt.datetime.now().isoformat(timespec="seconds")
     for result in analysis_results:
@@ -45,4 +49,70 @@ def append_verdicts(analysis_results: list[dict[str, Any]], path: pathlib.Path |
         history.setdefault(key, {})
         history[key][timestamp] = str(verdict)
     save_history(history, path)
+    append_histograms(analysis_results, timestamp, path)
     return history
+
+
+def histogram_history_path(path: pathlib.Path | None = None) -> pathlib.Path:
+    """Histograms are kept next to the verdict history, e.g. `past_results_histograms.json`."""
+    target = path or get_storage_path()
+    return target.with_name(f"{target.stem}_histograms{target.suffix}")
+
+
+def load_histogram_history(path: pathlib.Path | None = None) -> HistogramHistory:
+    """Load the stored run histograms of the verdict history at `path`."""
+    target = histogram_history_path(path)
+    if not target.exists():
+        return {}
+    try:
+        with target.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(k): dict(v) for k, v in data.items() if isinstance(v, dict)}
+
+
+def append_histograms(
+    analysis_results: list[dict[str, Any]], timestamp: str, path: pathlib.Path | None = None
+) -> HistogramHistory:
+    """Store the overall and per-API latency histograms of each result under `timestamp`."""
+    history = load_histogram_history(path)
+    for result in analysis_results:
+        histogram = result.get("response_time_histogram")
+        test_name = result.get("test_name")
+        if histogram is None or test_name is None:
+            continue
+        per_api = result.get("response_time_histogram_per_api") or {}
+        history.setdefault(str(test_name), {})[timestamp] = {
+            "overall": histogram.to_dict(),
+            "apis": {str(api): api_histogram.to_dict() for api, api_histogram in per_api.items()},
+        }
+    target = histogram_history_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=True)
+    return history
+
+
+def merged_run_histograms(
+    history: HistogramHistory, test_name: str
+) -> tuple[int, LatencyHistogram | None, dict[str, LatencyHistogram]]:
+    """Merge every stored run of a test: run count, overall and per-API histograms."""
+    runs = [history[test_name][timestamp] for timestamp in sorted(history.get(test_name, {}))]
+    if not runs:
+        return 0, None, {}
+    relative_error = float(runs[-1]["overall"]["relative_error"])
+    runs = [
+        run
+        for run in runs
+        if math.isclose(float(run["overall"]["relative_error"]), relative_error)
+    ]
+    overall = merge_histograms(LatencyHistogram.from_dict(run["overall"]) for run in runs)
+    per_api: dict[str, list[LatencyHistogram]] = {}
+    for run in runs:
+        for api, data in (run.get("apis") or {}).items():
+            per_api.setdefault(api, []).append(LatencyHistogram.from_dict(data))
+    merged_apis = {api: merge_histograms(histograms) for api, histograms in per_api.items()}
+    return len(runs), overall, {api: h for api, h in merged_apis.items() if h is not None}
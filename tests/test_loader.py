@@ -0,0 +1,234 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reportgen.analyzer import analyze_results_chunks, analyze_results_data
+from reportgen.loader import (
+    ReadOptions,
+    discover_tests,
+    iter_json_array,
+    iter_result_chunks,
+    iter_test_chunks,
+    read_results_file,
+)
+
+START_MS = 1_700_000_000_000
+
+
+def samples(rows=600, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "timeStamp": START_MS + np.sort(rng.integers(0, 30_000, rows)),
+            "elapsed": rng.integers(1, 1_000, rows),
+            "label": rng.choice(["GET /a", "POST /b"], rows),
+            "success": rng.random(rows) > 0.1,
+        }
+    )
+
+
+def write_jmeter_csv(directory, df):
+    file_path = directory / "t.csv"
+    df.assign(responseCode=np.where(df["success"], 200, 500)).to_csv(file_path, index=False)
+    return file_path
+
+
+def write_jmeter_xml(directory, df):
+    file_path = directory / "t.jtl"
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<testResults version="1.2">\n')
+        for row in df.itertuples():
+            ok = "true" if row.success else "false"
+            code = 200 if row.success else 500
+            f.write(
+                f'<httpSample t="{row.elapsed}" ts="{row.timeStamp}" s="{ok}" '
+                f'lb="{row.label}" rc="{code}"/>\n'
+            )
+        f.write("</testResults>\n")
+    return file_path
+
+
+def write_k6_csv(directory, df):
+    file_path = directory / "t.csv"
+    method, url = df["label"].str.split(" ", n=1, expand=True).T.to_numpy()
+    requests = pd.DataFrame(
+        {
+            "metric_name": "http_req_duration",
+            "timestamp": df["timeStamp"] // 1000,
+            "metric_value": df["elapsed"],
+            "method": method,
+            "url": url,
+            "status": np.where(df["success"], 200, 500),
+        }
+    )
+    other = requests.assign(metric_name="http_req_waiting")
+    pd.concat([requests, other]).sort_index(kind="stable").to_csv(file_path, index=False)
+    return file_path
+
+
+def write_k6_json(directory, df):
+    file_path = directory / "t.json"
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write('{"type":"Metric","data":{"name":"http_req_duration"},"metric":"http_req_duration"}\n')
+        for row in df.itertuples():
+            method, url = row.label.split(" ", 1)
+            time = pd.Timestamp(row.timeStamp, unit="ms", tz="UTC").isoformat()
+            point = {
+                "metric": "http_req_duration",
+                "type": "Point",
+                "data": {
+                    "time": time,
+                    "value": row.elapsed,
+                    "tags": {"method": method, "url": url, "status": "200" if row.success else "500"},
+                },
+            }
+            f.write(json.dumps(point) + "\n")
+    return file_path
+
+
+def write_gatling(directory, df):
+    file_path = directory / "simulation.log"
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(f"RUN\tsim.Basic\tbasic\t{START_MS}\t \t3.9.5\n")
+        for row in df.itertuples():
+            status, message = ("OK", "") if row.success else ("KO", "but actually found 500")
+            end = row.timeStamp + row.elapsed
+            f.write(f"REQUEST\t\t{row.label}\t{row.timeStamp}\t{end}\t{status}\t{message}\n")
+    return file_path
+
+
+def write_locust(directory, df):
+    file_path = directory / "t_stats_history.csv"
+    second = (df["timeStamp"] // 1000).rename("Timestamp")
+    intervals = df.groupby([second, "label"]).agg(
+        requests=("elapsed", "size"),
+        failures=("success", lambda s: int((~s).sum())),
+        elapsed=("elapsed", "sum"),
+    )
+    rows = []
+    totals = {}
+    for (timestamp, label), interval in intervals.iterrows():
+        count, failures, elapsed = totals.get(label, (0, 0, 0))
+        count += interval["requests"]
+        failures += interval["failures"]
+        elapsed += interval["elapsed"]
+        totals[label] = (count, failures, elapsed)
+        method, name = label.split(" ", 1)
+        rows.append((timestamp, method, name, count, failures, elapsed / count))
+    history = pd.DataFrame(
+        rows,
+        columns=[
+            "Timestamp",
+            "Type",
+            "Name",
+            "Total Request Count",
+            "Total Failure Count",
+            "Total Average Response Time",
+        ],
+    )
+    history.to_csv(file_path, index=False)
+    return file_path
+
+
+FORMATS = {
+    "jmeter-csv": ("jmeter", write_jmeter_csv),
+    "jmeter-xml": ("jmeter", write_jmeter_xml),
+    "k6": ("k6", write_k6_csv),
+    "k6-json": ("k6-json", write_k6_json),
+    "gatling": ("gatling", write_gatling),
+    "locust": ("locust", write_locust),
+}
+
+
+@pytest.mark.parametrize("name", FORMATS)
+@pytest.mark.parametrize("compact", [False, True])
+def test_streaming_matches_eager_analysis(tmp_path, name, compact):
+    generator, write = FORMATS[name]
+    file_path = str(write(tmp_path, samples()))
+    options = ReadOptions(compact=compact)
+    eager = analyze_results_data("s.t", read_results_file(file_path, generator, options))
+    streamed = analyze_results_chunks("s.t", iter_result_chunks(file_path, generator, 50, options))
+
+    for key in (
+        "overall_transaction_count",
+        "overall_error_count",
+        "test_duration_in_seconds",
+        "response_code_counts",
+    ):
+        assert streamed[key] == eager[key], key
+    for key in ("transaction_count_per_api", "error_count_per_api"):
+        assert {str(k): v for k, v in streamed[key].items()} == {
+            str(k): v for k, v in eager[key].items()
+        }, key
+    for key in ("transaction_count_per_second", "error_count_per_second"):
+        assert streamed[key].origin == eager[key].origin
+        assert np.array_equal(streamed[key].array, eager[key].array), key
+    assert streamed["overall_avg_response_time"] == pytest.approx(eager["overall_avg_response_time"])
+    # streamed percentiles come from the latency histogram
+    for percentile, value in eager["response_time_percentiles"].items():
+        assert streamed["response_time_percentiles"][percentile] == pytest.approx(value, rel=0.03)
+
+
+def test_sharded_test_is_streamed_in_timestamp_order(tmp_path):
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    df = samples(2_000)
+    # each shard is written in completion order, like JMeter does
+    for shard, part in enumerate((df.iloc[::2], df.iloc[1::2]), start=1):
+        order = np.argsort((part["timeStamp"] + part["elapsed"]).to_numpy(), kind="stable")
+        write_jmeter_csv(suite, part.iloc[order])
+        os.rename(suite / "t.csv", suite / f"t.node{shard}.csv")
+    [entry] = discover_tests(str(tmp_path), "jmeter")
+    assert entry.shard_names == ("node1", "node2")
+
+    chunks = list(iter_test_chunks(entry, "jmeter", 100))
+    stamps = pd.concat(chunks, ignore_index=True)["timeStamp"].to_numpy()
+    assert (np.diff(stamps) >= 0).all()
+    assert np.array_equal(stamps, np.sort(df["timeStamp"].to_numpy()))
+
+
+def test_cache_is_reused_and_invalidated(tmp_path, monkeypatch):
+    df = samples()
+    file_path = str(write_jmeter_csv(tmp_path, df))
+    options = ReadOptions(cache=True)
+    first = read_results_file(file_path, "jmeter", options)
+
+    def no_parse(name):
+        raise AssertionError("the cached frame should have been used")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("reportgen.loader.get_generator", no_parse)
+        cached = read_results_file(file_path, "jmeter", options)
+        with pytest.raises(AssertionError):
+            # frames cached by older normalization code are not served
+            patch.setattr("reportgen.loader.NORMALIZATION_VERSION", -1)
+            read_results_file(file_path, "jmeter", options)
+    pd.testing.assert_frame_equal(cached, first, check_categorical=False)
+
+    write_jmeter_csv(tmp_path, df.iloc[:100])
+    assert len(read_results_file(file_path, "jmeter", options)) == 100
+    compact = read_results_file(file_path, "jmeter", ReadOptions(cache=True, compact=True))
+    assert len(compact) == 100
+    assert list(compact.columns) == ["label", "timeStamp", "elapsed", "success", "responseCode"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["[1, 2] trailing", '{"timestamp": 1}', "[1, 2", "[1,, 2]", "[1 2]", "3"],
+)
+def test_malformed_json_is_rejected(tmp_path, text):
+    file_path = tmp_path / "t_resources.json"
+    file_path.write_text(text, encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(str(file_path), block_size=2))
+
+
+def test_json_array_is_streamed(tmp_path):
+    file_path = tmp_path / "t_resources.json"
+    file_path.write_text(' [ {"a": [1, 2]}, 1.5e3, "x" ]\n', encoding="utf-8")
+    assert list(iter_json_array(str(file_path), block_size=2)) == [{"a": [1, 2]}, 1500.0, "x"]
+    file_path.write_text("null", encoding="utf-8")
+    assert list(iter_json_array(str(file_path))) == []
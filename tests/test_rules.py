@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reportgen.analyzer import analyze_results_data
+from reportgen.rules import compile_rules, evaluate_rules
+
+
+def results_frame(seconds=20):
+    second = np.repeat(np.arange(seconds), 10)
+    slow = np.tile(np.arange(10) >= 5, seconds)
+    return pd.DataFrame(
+        {
+            "label": np.where(slow, "b", "a"),
+            "timeStamp": 1_700_000_000_000 + second * 1000,
+            "elapsed": np.where(slow, 900, 100),
+            # every slow request of the first second fails
+            "success": ~(slow & (second == 0)),
+            "responseCode": np.where(slow & (second == 0), "500", "200"),
+        }
+    )
+
+
+RULES = compile_rules(
+    {
+        "rules": [
+            {"name": "errors", "metric": "error_rate", "max": 0.01},
+            {"name": "p99 per api", "metric": "p99", "scope": "per_api", "max": 500},
+            {"name": "tps", "metric": "tps", "scope": "per_second", "min": 5},
+            {"name": "tps 10s", "metric": "tps", "scope": "per_second", "window": 10, "min": 10},
+        ]
+    },
+    [10, 60],
+)
+
+
+def test_rule_outcomes():
+    result = analyze_results_data("s.t", results_frame())
+    outcomes = {outcome.rule.name: outcome for outcome in evaluate_rules(result, RULES)}
+    assert outcomes["errors"].status == "FAIL"
+    assert outcomes["errors"].value == pytest.approx(5 / 200)
+    assert outcomes["p99 per api"].status == "FAIL"
+    assert list(outcomes["p99 per api"].offenders) == ["b"]
+    assert outcomes["tps"].status == "PASS"
+    assert outcomes["tps 10s"].status == "PASS"
+    assert outcomes["tps 10s"].value == pytest.approx(10)
+
+
+def test_rules_without_requests_have_no_data():
+    result = analyze_results_data("s.t", results_frame().iloc[:0])
+    outcomes = evaluate_rules(result, RULES)
+    assert [outcome.status for outcome in outcomes] == ["NO DATA"] * len(RULES)
+    assert not any(outcome.passed for outcome in outcomes)
+
+
+def test_unconfigured_window_is_rejected_when_compiled():
+    with pytest.raises(ValueError, match="rolling_windows_in_seconds"):
+        compile_rules(
+            {"rules": [{"metric": "tps", "scope": "per_second", "window": 30, "min": 1}]},
+            [10, 60],
+        )
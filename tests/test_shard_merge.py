@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reportgen.loader import merge_shard_chunks
+
+
+def completion_ordered_shard(rows, seed):
+    rng = np.random.default_rng(seed)
+    start = np.sort(rng.integers(0, 1_000_000, rows))
+    elapsed = rng.exponential(200, rows).astype(np.int64)
+    # JTL files are written as samples complete, not as they start
+    order = np.argsort(start + elapsed, kind="stable")
+    return pd.DataFrame(
+        {"label": "api", "timeStamp": start[order], "elapsed": elapsed[order]}
+    )
+
+
+def chunked(df, chunk_size):
+    return iter([df.iloc[start : start + chunk_size] for start in range(0, len(df), chunk_size)])
+
+
+@pytest.mark.parametrize("chunk_size", [50, 1_000])
+def test_interleaved_shards_merge_in_timestamp_order(chunk_size):
+    shards = [completion_ordered_shard(20_000, seed) for seed in range(3)]
+    offsets = [0, 5, -3]
+    chunks = list(
+        merge_shard_chunks([chunked(df, chunk_size) for df in shards], offsets, chunk_size)
+    )
+    stamps = pd.concat(chunks, ignore_index=True)["timeStamp"].to_numpy()
+    assert (np.diff(stamps) >= 0).all()
+    expected = np.concatenate([df["timeStamp"] + offset for df, offset in zip(shards, offsets)])
+    assert np.array_equal(stamps, np.sort(expected))
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reportgen.analyzer import analyze_results_chunks, analyze_results_data, find_steady_state
+from reportgen.config_store import get_config, set_config
+
+
+@pytest.fixture
+def steady_state_config():
+    previous = get_config()
+    set_config(
+        {
+            **previous,
+            "steady_state": {"enabled": True, "window_seconds": 4, "tolerance": 0.7},
+        }
+    )
+    yield
+    set_config(previous)
+
+
+def results_frame(counts):
+    seconds = np.repeat(np.arange(len(counts)), counts)
+    return pd.DataFrame(
+        {
+            "label": "api",
+            "timeStamp": 1_700_000_000_000 + seconds * 1000,
+            "elapsed": 100,
+            "success": True,
+            "responseCode": "200",
+        }
+    )
+
+
+def test_trimmed_series_starts_on_first_kept_second(steady_state_config):
+    # ramp-up, one empty second whose centered window already looks steady,
+    # plateau, ramp-down
+    counts = [2] * 5 + [0] + [20] * 40 + [2] * 5
+    df = results_frame(counts)
+    for result in (
+        analyze_results_data("t", df),
+        analyze_results_chunks("t", iter([df.iloc[:100], df.iloc[100:]])),
+    ):
+        steady_state = result["steady_state"]
+        assert steady_state["detected"]
+        assert steady_state["start_offset"] == 7
+        assert steady_state["trimmed_start_seconds"] == 6
+        tps = result["transaction_count_per_second"]
+        assert tps.origin == 7
+        assert tps[7] == 20
+        assert 6 not in tps
+        assert list(tps.seconds) == list(range(7, 7 + len(tps)))
+        assert result["overall_transaction_count"] == sum(tps.values())
+
+
+def ramp(start, stop, seconds):
+    return np.linspace(start, stop, seconds).round().astype(int).tolist()
+
+
+def test_long_ramp_is_trimmed_up_to_the_plateau():
+    counts = np.array(ramp(0, 50, 400) + [50] * 300)
+    first, last = find_steady_state(counts, 10, 0.1)
+    # the last tenth of the ramp is within tolerance of the plateau
+    assert 360 <= first < 400
+    assert last == 699
+
+
+def test_step_load_keeps_the_longest_step():
+    counts = np.array([20] * 250 + [40] * 250 + [60] * 300)
+    first, last = find_steady_state(counts, 10, 0.1)
+    assert 500 <= first <= 505
+    assert last == 799
+
+
+def test_ramp_down_is_trimmed():
+    counts = np.array(ramp(0, 50, 200) + [50] * 300 + ramp(50, 0, 250))
+    first, last = find_steady_state(counts, 10, 0.1)
+    assert 180 <= first < 200
+    assert 499 <= last <= 525
+
+
+def test_no_requests_has_no_plateau():
+    assert find_steady_state(np.zeros(30, dtype=np.int64), 10, 0.1) is None
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from reportgen.analyzer import analyze_results_data
+from reportgen.storage import append_verdicts, load_histogram_history, merged_run_histograms
+
+
+def run_result(elapsed):
+    return analyze_results_data(
+        "suite.test",
+        pd.DataFrame(
+            {
+                "label": ["a", "b"] * (len(elapsed) // 2),
+                "timeStamp": 1_700_000_000_000 + np.arange(len(elapsed)) * 10,
+                "elapsed": elapsed,
+                "success": True,
+                "responseCode": "200",
+            }
+        ),
+    )
+
+
+def test_run_histograms_are_stored_and_merged(tmp_path, monkeypatch):
+    path = tmp_path / "past_results.json"
+    timestamps = iter(["2026-01-01T00:00:00", "2026-01-02T00:00:00"])
+
+    class FixedClock:
+        @staticmethod
+        def now():
+            return pd.Timestamp(next(timestamps)).to_pydatetime()
+
+    monkeypatch.setattr("reportgen.storage.dt.datetime", FixedClock)
+    first = run_result(np.full(100, 100))
+    second = run_result(np.full(100, 1_000))
+    append_verdicts([first], path)
+    append_verdicts([second], path)
+
+    history = load_histogram_history(path)
+    assert len(history["suite.test"]) == 2
+    runs, overall, per_api = merged_run_histograms(history, "suite.test")
+    assert runs == 2
+    assert overall.total_count == 200
+    assert sorted(per_api) == ["a", "b"]
+    assert per_api["a"].total_count == 100
+    low, high = overall.percentiles([25, 75])
+    assert abs(low - 100) <= 100 * overall.relative_error
+    assert abs(high - 1_000) <= 1_000 * overall.relative_error